@@ -6,7 +6,12 @@ Blender's Python API. Works both inside Blender and as standalone
 tool for mesh export.
 """
 
+import contextlib
+import functools
+import io
+import re
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 
 # Try to import Blender, but allow standalone usage
 try:
@@ -16,6 +21,13 @@ except ImportError:
     BLENDER_AVAILABLE = False
     print("Warning: Blender (bpy) not available. Mesh creation will be disabled.")
 
+# scikit-image is only needed for isosurface extraction
+try:
+    from skimage import measure
+    SKIMAGE_AVAILABLE = True
+except ImportError:
+    SKIMAGE_AVAILABLE = False
+
 # Import quantum modules
 import sys
 from pathlib import Path
@@ -30,57 +42,429 @@ from Quantum.quantum_constants import (
     DEFAULT_GRID_RESOLUTION,
     DEFAULT_ISO_VALUES,
     get_orbital_color,
+    get_orbital_extent,
     get_orbital_name,
 )
-from Quantum.hydrogen_wavefunctions import calculate_density_grid
+from Quantum.hydrogen_wavefunctions import cached_density_grid, iter_density_slabs
 
 # ============================================================================
 # Mesh Generation (using scikit-image marching cubes)
 # ============================================================================
 
-def generate_isosurface_mesh(density_grid, x_grid, y_grid, z_grid, iso_value):
+def precompute_grid_params(x_grid, y_grid, z_grid):
     """
-    Generate isosurface mesh from density grid using marching cubes.
+    Extract marching cubes spacing and grid origin from coordinate grids.
+
+    These are invariant across isosurface levels, so callers extracting
+    several isosurfaces from one grid should compute them once.
 
     Args:
-        density_grid: 3D array of density values
         x_grid, y_grid, z_grid: Coordinate grids
+
+    Returns:
+        tuple: (spacing, origin) as (dx, dy, dz) and (x0, y0, z0) floats
+    """
+    x0 = float(x_grid[0, 0, 0])
+    y0 = float(y_grid[0, 0, 0])
+    z0 = float(z_grid[0, 0, 0])
+
+    spacing = (
+        float(x_grid[1, 0, 0]) - x0,
+        float(y_grid[0, 1, 0]) - y0,
+        float(z_grid[0, 0, 1]) - z0,
+    )
+
+    return spacing, (x0, y0, z0)
+
+def generate_isosurface_mesh_fast(density_grid, spacing, origin, iso_value, step_size=1):
+    """
+    Generate isosurface mesh from density grid using precomputed grid params.
+
+    Args:
+        density_grid: 3D array of density values
+        spacing: (dx, dy, dz) grid spacing
+        origin: (x0, y0, z0) position of the first grid point
         iso_value: Isosurface threshold value
+        step_size: Voxels per marching cube; 2 samples every other voxel,
+            for about 8x less work and 4x fewer vertices
 
     Returns:
         tuple: (vertices, faces) where vertices is Nx3 array, faces is Mx3 array
     """
-    try:
-        from skimage import measure
-    except ImportError:
+    if not SKIMAGE_AVAILABLE:
         raise ImportError(
             "scikit-image required for mesh generation. "
             "Install with: pip install scikit-image"
         )
 
+    # float32 halves the memory traffic of the marching cubes volume scan.
+    # marching_cubes rejects read-only buffers (e.g. a crop of a
+    # cached_density_grid result), so those are copied
+    density_grid = np.require(density_grid, np.float32, ['W'])
+
     # Run marching cubes
     verts, faces, normals, values = measure.marching_cubes(
         density_grid,
         level=iso_value,
-        spacing=(
-            x_grid[1, 0, 0] - x_grid[0, 0, 0],
-            y_grid[0, 1, 0] - y_grid[0, 0, 0],
-            z_grid[0, 0, 1] - z_grid[0, 0, 0],
-        )
+        spacing=spacing,
+        step_size=step_size,
     )
 
-    # Offset vertices to match grid origin
-    verts[:, 0] += x_grid[0, 0, 0]
-    verts[:, 1] += y_grid[0, 0, 0]
-    verts[:, 2] += z_grid[0, 0, 0]
+    # Offset vertices to match grid origin (single in-place pass over Nx3)
+    np.add(verts, np.asarray(origin, dtype=verts.dtype), out=verts)
 
     return verts, faces
 
+def _axis_profiles(density_grid):
+    """
+    Calculate the maximum density in each x, y and z slice of a grid.
+
+    Computed once per grid and shared by every iso value, these profiles
+    give the bounding box of the region above any threshold.
+
+    Args:
+        density_grid: 3D array of density values
+
+    Returns:
+        tuple: (x_profile, y_profile, z_profile) 1-D arrays
+    """
+    xy_max = density_grid.max(axis=2)
+
+    return xy_max.max(axis=1), xy_max.max(axis=0), density_grid.max(axis=(0, 1))
+
+def _narrow_band_box(profiles, iso_value, pad=1):
+    """
+    Get the grid index box enclosing every voxel at or above iso_value.
+
+    The box is padded so that every cube straddling the isosurface is
+    inside it.
+
+    Args:
+        profiles: Per-axis maximum profiles from _axis_profiles
+        iso_value: Isosurface threshold value
+        pad: Voxels of padding per side (the marching cubes step size)
+
+    Returns:
+        tuple: (start, stop) index per axis, or None if no voxel reaches iso_value
+    """
+    box = []
+    for profile in profiles:
+        above = np.flatnonzero(profile >= iso_value)
+        if len(above) == 0:
+            return None
+        box.append((max(above[0] - pad, 0), min(above[-1] + pad + 1, len(profile))))
+
+    return box
+
+def generate_isosurface_meshes(density_grid, spacing, origin, iso_values, max_workers=None,
+                               step_sizes=None):
+    """
+    Generate one isosurface mesh per iso value from a shared density grid.
+
+    Each iso value only runs marching cubes over the narrow band (bounding
+    box) of voxels that reach it, found from per-axis profiles computed once
+    for all levels. Marching cubes releases the GIL, so the iso values are
+    extracted concurrently on a thread pool. Levels with no surface yield None.
+
+    Args:
+        density_grid: 3D array of density values
+        spacing: (dx, dy, dz) grid spacing
+        origin: (x0, y0, z0) position of the first grid point
+        iso_values: List of isosurface threshold values
+        max_workers: Thread count (default: one per iso value)
+        step_sizes: Marching cubes step size per iso value (default: all 1);
+            smooth outer shells can use 2
+
+    Returns:
+        list: (vertices, faces) tuple or None for each iso value, in order
+    """
+    return list(iter_isosurface_meshes(
+        density_grid, spacing, origin, iso_values, max_workers, step_sizes
+    ))
+
+def iter_isosurface_meshes(density_grid, spacing, origin, iso_values, max_workers=None,
+                           step_sizes=None):
+    """
+    Yield the meshes of generate_isosurface_meshes as each becomes ready.
+
+    Meshes come out in iso value order while later levels are still being
+    extracted on the thread pool, so a consumer on the main thread (e.g.
+    creating Blender objects, which must stay there) overlaps with the
+    remaining marching cubes work.
+
+    Args:
+        density_grid: 3D array of density values
+        spacing: (dx, dy, dz) grid spacing
+        origin: (x0, y0, z0) position of the first grid point
+        iso_values: List of isosurface threshold values
+        max_workers: Thread count (default: one per iso value)
+        step_sizes: Marching cubes step size per iso value (default: all 1)
+
+    Yields:
+        (vertices, faces) tuple or None for each iso value, in order
+    """
+    if len(iso_values) == 0:
+        return
+
+    # Cast once here rather than in every worker
+    density_grid = np.asarray(density_grid).astype(np.float32, copy=False)
+    profiles = _axis_profiles(density_grid)
+
+    # Every voxel is above a level at or below the minimum, so there is no
+    # surface; screening here avoids marching cubes' ValueError path
+    grid_min = float(density_grid.min())
+
+    def extract(iso_value, step_size):
+        if iso_value <= grid_min:
+            print(f"Warning: Could not generate isosurface at {iso_value}: "
+                  f"every voxel is above this level")
+            return None
+
+        # Pad by a full step so the coarse lattice still brackets the surface
+        box = _narrow_band_box(profiles, iso_value, pad=step_size)
+        if box is None:
+            print(f"Warning: Could not generate isosurface at {iso_value}: "
+                  f"no density reaches this level")
+            return None
+
+        (x0, x1), (y0, y1), (z0, z1) = box
+        band_origin = tuple(o + start * d for o, start, d in zip(origin, (x0, y0, z0), spacing))
+
+        try:
+            verts, faces = generate_isosurface_mesh_fast(
+                density_grid[x0:x1, y0:y1, z0:z1], spacing, band_origin, iso_value,
+                step_size=step_size
+            )
+        except ValueError as e:
+            print(f"Warning: Could not generate isosurface at {iso_value}: {e}")
+            return None
+
+        if len(verts) == 0 or len(faces) == 0:
+            return None
+
+        return verts, faces
+
+    if max_workers is None:
+        max_workers = len(iso_values)
+
+    if step_sizes is None:
+        step_sizes = [1] * len(iso_values)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(extract, iso_values, step_sizes)
+
+def _weld_seam_vertices(verts, faces, spacing):
+    """
+    Merge coincident vertices, such as copies produced on both sides of a slab seam.
+
+    Args:
+        verts: Nx3 array of vertex positions
+        faces: Mx3 array of face indices
+        spacing: (dx, dy, dz) grid spacing, used to quantize positions
+
+    Returns:
+        tuple: (vertices, faces) with duplicate vertices removed
+    """
+    keys = np.round(verts / (np.asarray(spacing) * 1e-4)).astype(np.int64)
+    _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+
+    return verts[first], inverse.reshape(-1)[faces]
+
+def generate_isosurface_meshes_streamed(slabs, spacing, origin, iso_values, scale=1.0):
+    """
+    Generate isosurface meshes from a stream of overlapping z-slabs.
+
+    Marching cubes runs on each slab as it arrives (see iter_density_slabs),
+    so the full density volume never has to be held in memory. The pieces
+    of each isosurface are stitched by welding the vertices that adjacent
+    slabs both produce on their shared slice.
+
+    Args:
+        slabs: Iterable of (z_start, density_slab) pairs
+        spacing: (dx, dy, dz) grid spacing
+        origin: (x0, y0, z0) position of the first grid point
+        iso_values: List of isosurface threshold values
+        scale: Factor applied to each slab before thresholding (e.g. 1/max)
+
+    Returns:
+        list: (vertices, faces) tuple or None for each iso value, in order
+    """
+    pieces = [[] for _ in iso_values]
+
+    for z_start, slab in slabs:
+        slab = np.asarray(slab).astype(np.float32, copy=False)
+        if scale != 1.0:
+            slab = slab * np.float32(scale)
+
+        slab_min, slab_max = float(slab.min()), float(slab.max())
+        slab_origin = (origin[0], origin[1], origin[2] + z_start * spacing[2])
+
+        for i, iso_value in enumerate(iso_values):
+            if not slab_min <= iso_value <= slab_max:
+                continue
+
+            try:
+                verts, faces = generate_isosurface_mesh_fast(
+                    slab, spacing, slab_origin, iso_value
+                )
+            except ValueError:
+                continue
+
+            if len(faces) > 0:
+                pieces[i].append((verts, faces))
+
+    meshes = []
+    for iso_value, iso_pieces in zip(iso_values, pieces):
+        if not iso_pieces:
+            print(f"Warning: Could not generate isosurface at {iso_value}: "
+                  f"no density reaches this level")
+            meshes.append(None)
+            continue
+
+        offsets = np.cumsum([0] + [len(verts) for verts, _ in iso_pieces[:-1]])
+        verts = np.concatenate([verts for verts, _ in iso_pieces])
+        faces = np.concatenate([
+            faces + offset for (_, faces), offset in zip(iso_pieces, offsets)
+        ])
+
+        meshes.append(_weld_seam_vertices(verts, faces, spacing))
+
+    return meshes
+
+def _iso_alphas(color, num_levels):
+    """
+    Calculate per-isosurface alpha values, fading from the base alpha.
+
+    Args:
+        color: Base RGBA color tuple
+        num_levels: Number of isosurface levels
+
+    Returns:
+        list: Alpha value for each isosurface level
+    """
+    return (color[3] * (1.0 - np.arange(num_levels) / num_levels)).tolist()
+
+def batch_create_isosurfaces(density_grid, spacing, origin, iso_values, base_color):
+    """
+    Extract all isosurfaces of a grid together with their display colors.
+
+    All compute-bound work happens here, with no Blender calls, so the
+    result can be turned into objects by a simple serial loop.
+
+    Args:
+        density_grid: 3D array of density values
+        spacing: (dx, dy, dz) grid spacing
+        origin: (x0, y0, z0) position of the first grid point
+        iso_values: List of isosurface threshold values
+        base_color: RGBA color; alpha fades out with isosurface level
+
+    Returns:
+        list: (vertices, faces, rgba) tuple or None for each iso value, in order
+    """
+    meshes = generate_isosurface_meshes(density_grid, spacing, origin, iso_values)
+
+    return _attach_iso_colors(meshes, base_color)
+
+def _attach_iso_colors(meshes, base_color):
+    """
+    Pair each isosurface mesh with its faded display color.
+
+    Args:
+        meshes: (vertices, faces) tuple or None per iso value
+        base_color: RGBA color; alpha fades out with isosurface level
+
+    Returns:
+        list: (vertices, faces, rgba) tuple or None for each mesh, in order
+    """
+    alphas = _iso_alphas(base_color, len(meshes))
+
+    return [
+        None if mesh is None else (*mesh, (*base_color[:3], alpha))
+        for mesh, alpha in zip(meshes, alphas)
+    ]
+
+def generate_isosurface_mesh(density_grid, x_grid, y_grid, z_grid, iso_value):
+    """
+    Generate isosurface mesh from density grid using marching cubes.
+
+    Args:
+        density_grid: 3D array of density values
+        x_grid, y_grid, z_grid: Coordinate grids
+        iso_value: Isosurface threshold value
+
+    Returns:
+        tuple: (vertices, faces) where vertices is Nx3 array, faces is Mx3 array
+    """
+    spacing, origin = precompute_grid_params(x_grid, y_grid, z_grid)
+    return generate_isosurface_mesh_fast(density_grid, spacing, origin, iso_value)
+
 # ============================================================================
 # Blender Mesh Creation
 # ============================================================================
 
-def create_blender_mesh(name, vertices, faces, color=None):
+def create_shared_material(name):
+    """
+    Create a transparent material colored by each object's own color.
+
+    The Principled BSDF reads Base Color and Alpha from an Object Info
+    node, so one material can serve every isosurface of an orbital while
+    each object keeps its own faded alpha in obj.color.
+
+    Args:
+        name: Name for the material
+
+    Returns:
+        bpy.types.Material: Created material (if Blender available)
+    """
+    if not BLENDER_AVAILABLE:
+        raise RuntimeError("Blender not available. Cannot create material.")
+
+    mat = bpy.data.materials.new(name=name)
+    mat.use_nodes = True
+
+    bsdf = mat.node_tree.nodes.get("Principled BSDF")
+    if bsdf:
+        object_info = mat.node_tree.nodes.new("ShaderNodeObjectInfo")
+        mat.node_tree.links.new(object_info.outputs['Color'], bsdf.inputs['Base Color'])
+        mat.node_tree.links.new(object_info.outputs['Alpha'], bsdf.inputs['Alpha'])
+
+        # Enable transparency
+        mat.blend_method = 'BLEND'
+        mat.show_transparent_back = True
+
+    return mat
+
+def create_emissive_material(name, color, emission_strength=2.0):
+    """
+    Create an opaque material that glows in a single color.
+
+    Used for labels and reference lines; their Principled BSDF Base Color
+    and Emission are both set to color.
+
+    Args:
+        name: Name for the material
+        color: RGBA color tuple
+        emission_strength: Emission strength (0 for no glow)
+
+    Returns:
+        bpy.types.Material: Created material (if Blender available)
+    """
+    if not BLENDER_AVAILABLE:
+        raise RuntimeError("Blender not available. Cannot create material.")
+
+    mat = bpy.data.materials.new(name=name)
+    mat.use_nodes = True
+
+    bsdf = mat.node_tree.nodes.get("Principled BSDF")
+    if bsdf:
+        inputs = bsdf.inputs
+        inputs['Base Color'].default_value = color
+        inputs['Emission'].default_value = color
+        inputs['Emission Strength'].default_value = emission_strength
+
+    return mat
+
+def create_blender_mesh(name, vertices, faces, color=None, material=None, location=None):
     """
     Create a Blender mesh object from vertices and faces.
 
@@ -89,6 +473,10 @@ def create_blender_mesh(name, vertices, faces, color=None):
         vertices: Nx3 numpy array of vertex positions
         faces: Mx3 numpy array of face indices
         color: Optional RGBA color tuple
+        material: Optional existing material to assign (e.g. from
+            create_shared_material); color is then stored in obj.color
+            instead of creating a new material
+        location: Optional (x, y, z) object location
 
     Returns:
         bpy.types.Object: Created mesh object (if Blender available)
@@ -99,22 +487,49 @@ def create_blender_mesh(name, vertices, faces, color=None):
     # Create mesh data
     mesh = bpy.data.meshes.new(name=f"{name}_mesh")
 
-    # Convert to lists for Blender
-    verts_list = vertices.tolist()
-    faces_list = faces.tolist()
+    # Bulk-copy the numpy buffers with foreach_set instead of converting
+    # them to nested Python lists for from_pydata
+    num_verts = len(vertices)
+    num_faces = len(faces)
+
+    mesh.vertices.add(num_verts)
+    mesh.vertices.foreach_set(
+        "co", np.ascontiguousarray(vertices, dtype=np.float32).ravel()
+    )
 
-    # Create mesh from data
-    mesh.from_pydata(verts_list, [], faces_list)
-    mesh.update()
+    # Marching cubes faces are all triangles
+    mesh.loops.add(num_faces * 3)
+    mesh.loops.foreach_set(
+        "vertex_index", np.ascontiguousarray(faces, dtype=np.int32).ravel()
+    )
+
+    mesh.polygons.add(num_faces)
+    mesh.polygons.foreach_set(
+        "loop_start", np.arange(0, num_faces * 3, 3, dtype=np.int32)
+    )
+    try:
+        mesh.polygons.foreach_set("loop_total", np.full(num_faces, 3, dtype=np.int32))
+    except (AttributeError, TypeError):
+        # Newer Blender derives loop_total from loop_start (read-only)
+        pass
+
+    mesh.update(calc_edges=True)
 
     # Create object
     obj = bpy.data.objects.new(name, mesh)
+    if location is not None:
+        obj.location = location
 
     # Add to scene
     bpy.context.collection.objects.link(obj)
 
+    if material is not None:
+        if color is not None:
+            obj.color = color
+        obj.data.materials.append(material)
+
     # Create material if color provided
-    if color is not None:
+    elif color is not None:
         mat = bpy.data.materials.new(name=f"{name}_material")
         mat.use_nodes = True
 
@@ -134,17 +549,110 @@ def create_blender_mesh(name, vertices, faces, color=None):
         else:
             obj.data.materials.append(mat)
 
-    # Smooth shading
-    for poly in mesh.polygons:
-        poly.use_smooth = True
+    # Smooth shading (single bulk write instead of per-polygon RNA access)
+    mesh.polygons.foreach_set("use_smooth", np.ones(num_faces, dtype=bool))
 
     return obj
 
+def _peak_iso_values(iso_levels, density_grid, peak=None):
+    """
+    Convert isosurface levels given as fractions of the peak to densities.
+
+    Args:
+        iso_levels: Isosurface levels as fractions of the peak density
+        density_grid: 3D array of (unnormalized) density values
+        peak: Peak density (computed from density_grid if not given)
+
+    Returns:
+        list: Isosurface threshold values on the grid's own scale
+    """
+    if peak is None:
+        peak = np.max(density_grid)
+
+    # Scaling the levels instead of normalizing the grid saves a full pass
+    # over the volume
+    if peak > 0:
+        return [iso * peak for iso in iso_levels]
+
+    return list(iso_levels)
+
+# Isosurface levels of the basis state shells, as fractions of the peak density
+ISO_GROUND = (0.05, 0.15, 0.30)   # Multiple shells for depth
+ISO_EXCITED = (0.02, 0.05, 0.15)  # Lower levels to show the outer shell and node
+
+# Marching cubes step per shell level: the smooth outer shells are sampled
+# at every other voxel, the innermost at full resolution
+SHELL_STEPS = (2, 2, 1)
+
+def build_shells(density, spacing, origin, iso_levels, colors, name_fmt, location=None,
+                 peak=None, step_sizes=None):
+    """
+    Create one Blender mesh object per isosurface shell of a density grid.
+
+    The grid spacing and origin are the same for every shell, so the caller
+    computes them once and passes them in.
+
+    Args:
+        density: 3D array of (unnormalized) density values
+        spacing: (dx, dy, dz) grid spacing
+        origin: (x0, y0, z0) position of the first grid point
+        iso_levels: Isosurface levels as fractions of the peak density
+        colors: RGBA color per level
+        name_fmt: Object name format string, formatted with the shell index
+        location: Optional (x, y, z) location for the created objects
+        peak: Peak density (computed from density if not given)
+        step_sizes: Optional marching cubes step per level
+
+    Returns:
+        list: Created objects (levels with no surface are skipped)
+    """
+    iso_values = _peak_iso_values(iso_levels, density, peak)
+
+    # Shells are extracted concurrently and handed over as each finishes, so
+    # creating the Blender objects (serially, on this thread) overlaps with
+    # marching cubes for the remaining levels
+    meshes = iter_isosurface_meshes(
+        density, spacing, origin, iso_values, step_sizes=step_sizes
+    )
+
+    # The shells differ only in color, so they share one material that reads
+    # each object's own color
+    material = None
+
+    objects = []
+    for i, (iso_val, color, mesh) in enumerate(zip(iso_levels, colors, meshes)):
+        print(f"  Creating isosurface {i+1}/{len(iso_levels)} at {iso_val*100:g}%...")
+
+        if mesh is None:
+            print(f"    Skipped (no surface at this level)")
+            continue
+
+        verts, faces = mesh
+
+        if material is None:
+            material = create_shared_material(f"{name_fmt.format('').rstrip('_')}_material")
+
+        # Create mesh in Blender
+        obj = create_blender_mesh(
+            name=name_fmt.format(i),
+            vertices=verts,
+            faces=faces,
+            color=color,
+            material=material,
+            location=location
+        )
+
+        objects.append(obj)
+        print(f"    Created with {len(verts)} vertices")
+
+    return objects
+
 # ============================================================================
 # Orbital Mesh Creation
 # ============================================================================
 
-def create_orbital_mesh(n, l, m, iso_values=None, resolution=None, name=None):
+def create_orbital_mesh(n, l, m, iso_values=None, resolution=None, name=None, slab_depth=None,
+                        location=None):
     """
     Create Blender mesh for a single hydrogen orbital.
 
@@ -153,6 +661,10 @@ def create_orbital_mesh(n, l, m, iso_values=None, resolution=None, name=None):
         iso_values: List of isosurface values (default: from constants)
         resolution: Grid resolution (default: from constants)
         name: Custom name for mesh (default: auto-generated)
+        slab_depth: If set, stream the grid in z-slabs of this many cells
+            instead of holding the whole volume (for large resolutions;
+            the density is evaluated twice, once to find its maximum)
+        location: Optional (x, y, z) location for the created objects
 
     Returns:
         list: List of created Blender objects (one per isosurface)
@@ -169,49 +681,78 @@ def create_orbital_mesh(n, l, m, iso_values=None, resolution=None, name=None):
     if name is None:
         name = get_orbital_name(n, l, m)
 
-    # Calculate density grid
-    x_grid, y_grid, z_grid, density_grid = calculate_density_grid(
-        n, l, m, resolution=resolution
-    )
+    if slab_depth is not None:
+        surfaces = _stream_orbital_isosurfaces(n, l, m, iso_values, resolution, slab_depth)
+    else:
+        # Density grid, shared read-only between calls for the same orbital
+        x_grid, y_grid, z_grid, density_grid = cached_density_grid(
+            n, l, m, resolution=resolution
+        )
 
-    # Normalize density for consistent iso_values
-    max_density = np.max(density_grid)
-    if max_density > 0:
-        density_grid = density_grid / max_density
+        iso_values = _peak_iso_values(iso_values, density_grid)
 
-    # Create mesh for each isosurface
-    objects = []
-    color = get_orbital_color(l)
+        # Grid spacing/origin are shared by every isosurface
+        spacing, origin = precompute_grid_params(x_grid, y_grid, z_grid)
 
-    for i, iso_frac in enumerate(iso_values):
-        # Generate mesh
-        try:
-            verts, faces = generate_isosurface_mesh(
-                density_grid, x_grid, y_grid, z_grid, iso_frac
-            )
-        except ValueError as e:
-            print(f"Warning: Could not generate isosurface at {iso_frac}: {e}")
-            continue
+        # Marching cubes runs in parallel; Blender objects are created serially
+        surfaces = batch_create_isosurfaces(
+            density_grid, spacing, origin, iso_values, get_orbital_color(l)
+        )
 
-        if len(verts) == 0 or len(faces) == 0:
+    # Create mesh for each isosurface; they differ only in alpha, so all
+    # share one material driven by the per-object color
+    objects = []
+    material = None
+
+    for i, surface in enumerate(surfaces):
+        if surface is None:
             continue
+        verts, faces, iso_color = surface
 
-        # Adjust alpha based on isosurface level
-        iso_color = list(color[:3]) + [color[3] * (1.0 - i / len(iso_values))]
+        if material is None:
+            material = create_shared_material(f"{name}_material")
 
         # Create Blender object
         obj_name = f"{name}_iso{i}"
-        obj = create_blender_mesh(obj_name, verts, faces, color=iso_color)
+        obj = create_blender_mesh(
+            obj_name, verts, faces, color=iso_color, material=material, location=location
+        )
 
         objects.append(obj)
 
     return objects
 
+def _stream_orbital_isosurfaces(n, l, m, iso_values, resolution, slab_depth):
+    """
+    Extract the isosurfaces of an orbital without materializing its full grid.
+
+    Returns:
+        list: (vertices, faces, rgba) tuple or None for each iso value, in order
+    """
+    extent = get_orbital_extent(n)
+    step = 2.0 * extent / (resolution - 1)
+    spacing, origin = (step, step, step), (-extent, -extent, -extent)
+
+    def slabs():
+        return iter_density_slabs(
+            n, l, m, extent=extent, resolution=resolution,
+            slab_depth=slab_depth, dtype=np.float32
+        )
+
+    # First pass only finds the maximum used for normalization
+    max_density = max(float(slab.max()) for _, slab in slabs())
+    scale = 1.0 / max_density if max_density > 0 else 1.0
+
+    meshes = generate_isosurface_meshes_streamed(slabs(), spacing, origin, iso_values, scale)
+
+    return _attach_iso_colors(meshes, get_orbital_color(l))
+
 # ============================================================================
 # Bloch State Mesh Creation
 # ============================================================================
 
-def create_bloch_state_mesh(theta, phi, basis='sp', iso_values=None, resolution=None, name=None):
+def create_bloch_state_mesh(theta, phi, basis='sp', iso_values=None, resolution=None, name=None,
+                            location=None):
     """
     Create Blender mesh for a quantum state defined by Bloch angles.
 
@@ -221,6 +762,7 @@ def create_bloch_state_mesh(theta, phi, basis='sp', iso_values=None, resolution=
         iso_values: List of isosurface values
         resolution: Grid resolution
         name: Custom name for mesh
+        location: Optional (x, y, z) location for the created objects
 
     Returns:
         list: List of created Blender objects
@@ -231,47 +773,50 @@ def create_bloch_state_mesh(theta, phi, basis='sp', iso_values=None, resolution=
     # Create state
     state = create_bloch_state(theta, phi, basis)
 
+    return _create_state_mesh(state, basis, iso_values, resolution, name, location)
+
+
+def _create_state_mesh(state, basis, iso_values=None, resolution=None, name=None, location=None):
+    """
+    Create Blender meshes for an existing BlochOrbitalState.
+
+    Uses the state's cached density grid when it has one, so callers that
+    already hold a state do not pay for a second density evaluation.
+    """
     if name is None:
         info = state.get_visualization_info()
         name = f"{info['state_label']}_{basis}"
 
-    # Calculate density grid
+    # Calculate density grid (already float32; no copy when cached)
     x_grid, y_grid, z_grid, density_grid = state.calculate_density_grid(resolution=resolution)
-
-    # Normalize
-    max_density = np.max(density_grid)
-    if max_density > 0:
-        density_grid = density_grid / max_density
+    density_grid = density_grid.astype(np.float32, copy=False)
 
     if iso_values is None:
         iso_values = DEFAULT_ISO_VALUES
 
-    # Create mesh for each isosurface
-    objects = []
+    iso_values = _peak_iso_values(iso_values, density_grid)
 
     # Get dominant orbital for coloring
     dominant_nlm, _ = state.get_dominant_orbital()
     _, l, _ = dominant_nlm
-    color = get_orbital_color(l)
 
-    for i, iso_frac in enumerate(iso_values):
-        try:
-            verts, faces = generate_isosurface_mesh(
-                density_grid, x_grid, y_grid, z_grid, iso_frac
-            )
-        except ValueError as e:
-            print(f"Warning: Could not generate isosurface at {iso_frac}: {e}")
-            continue
+    spacing, origin = precompute_grid_params(x_grid, y_grid, z_grid)
 
-        if len(verts) == 0 or len(faces) == 0:
-            continue
+    surfaces = batch_create_isosurfaces(
+        density_grid, spacing, origin, iso_values, get_orbital_color(l)
+    )
 
-        # Adjust alpha
-        iso_color = list(color[:3]) + [color[3] * (1.0 - i / len(iso_values))]
+    # Create mesh for each isosurface
+    objects = []
+
+    for i, surface in enumerate(surfaces):
+        if surface is None:
+            continue
+        verts, faces, iso_color = surface
 
         # Create object
         obj_name = f"{name}_iso{i}"
-        obj = create_blender_mesh(obj_name, verts, faces, color=iso_color)
+        obj = create_blender_mesh(obj_name, verts, faces, color=iso_color, location=location)
 
         objects.append(obj)
 
@@ -309,46 +854,40 @@ def animate_gate_operation(initial_state, gate, duration=1.0, frames=60, basis='
     final_state = BlochOrbitalState(state.theta, state.phi, basis)
     final_state.apply_gate(gate)
 
-    # Create initial mesh
-    objects = create_bloch_state_mesh(
-        state.theta, state.phi, basis,
-        name=f"gate_anim_initial"
-    )
+    # Create initial mesh from the state itself (reuses its density cache)
+    objects = _create_state_mesh(state, basis, name="gate_anim_initial")
 
     # Set up animation
     fps = bpy.context.scene.render.fps
     frame_duration = int(duration * fps)
+    frame_nums = (np.arange(frames + 1) * frame_duration / frames).astype(int)
+
+    # Only the first object's material opacity is keyframed. The mesh
+    # geometry is shared by every frame: marching cubes produces a
+    # different vertex count per state, so per-frame meshes could not be
+    # keyframed anyway, and the interpolated density is not computed.
+    # The Alpha socket is looked up once; it is the same every frame.
+    alpha_input = None
+    if objects:
+        obj = objects[0]
+        if obj.data.materials:
+            mat = obj.data.materials[0]
+            if mat.use_nodes:
+                bsdf = mat.node_tree.nodes.get("Principled BSDF")
+                if bsdf:
+                    alpha_input = bsdf.inputs['Alpha']
 
-    for frame in range(frames + 1):
-        t = frame / frames
-
-        # Interpolate between states (linear on Bloch sphere)
-        theta_t = state.theta + t * (final_state.theta - state.theta)
-        phi_t = state.phi + t * (final_state.phi - state.phi)
-
-        # Calculate density for this frame
-        interp_state = create_bloch_state(theta_t, phi_t, basis)
-        x_grid, y_grid, z_grid, density = interp_state.calculate_density_grid()
-
-        # Update mesh (simplified - just update first object for demo)
-        if objects and len(objects) > 0:
-            obj = objects[0]
+    if objects:
+        for frame, frame_num in enumerate(frame_nums.tolist()):
+            t = frame / frames
 
             # Set keyframe for visibility/alpha
-            frame_num = int(frame * frame_duration / frames)
             bpy.context.scene.frame_set(frame_num)
 
-            # Could update mesh vertices here for smooth animation
-            # For now, just keyframe material opacity
-
-            if obj.data.materials:
-                mat = obj.data.materials[0]
-                if mat.use_nodes:
-                    bsdf = mat.node_tree.nodes.get("Principled BSDF")
-                    if bsdf:
-                        alpha_value = 0.7 * (1.0 - abs(2 * t - 1))  # Fade in/out
-                        bsdf.inputs['Alpha'].default_value = alpha_value
-                        bsdf.inputs['Alpha'].keyframe_insert(data_path="default_value", frame=frame_num)
+            if alpha_input is not None:
+                alpha_value = 0.7 * (1.0 - abs(2 * t - 1))  # Fade in/out
+                alpha_input.default_value = alpha_value
+                alpha_input.keyframe_insert(data_path="default_value", frame=frame_num)
 
     return objects
 
@@ -356,15 +895,59 @@ def animate_gate_operation(initial_state, gate, duration=1.0, frames=60, basis='
 # Utility Functions
 # ============================================================================
 
+# Object names created by this module (case-insensitive)
+_ORBITAL_NAME_PATTERN = re.compile(r'orbital|iso|bloch|gate', re.IGNORECASE)
+
 def clear_orbital_objects():
     """Remove all orbital-related objects from scene."""
     if not BLENDER_AVAILABLE:
         return
 
-    # Delete objects with orbital-related names
-    for obj in bpy.data.objects:
-        if any(keyword in obj.name.lower() for keyword in ['orbital', 'iso', 'bloch', 'gate']):
-            bpy.data.objects.remove(obj, do_unlink=True)
+    # Collect first (removing while iterating bpy.data.objects skips items),
+    # then delete in one batch
+    to_remove = [obj for obj in bpy.data.objects if _ORBITAL_NAME_PATTERN.search(obj.name)]
+    if to_remove:
+        bpy.data.batch_remove(ids=to_remove)
+
+def select_objects(objects, active=None):
+    """
+    Make the given objects the only selected ones.
+
+    Deselects through the current selection rather than the select_all
+    operator, which validates context and pushes an undo step.
+
+    Args:
+        objects: Blender objects to select
+        active: Optional object to make active
+    """
+    if not BLENDER_AVAILABLE:
+        return
+
+    for obj in bpy.context.selected_objects:
+        obj.select_set(False)
+
+    for obj in objects:
+        obj.select_set(True)
+
+    if active is not None:
+        bpy.context.view_layer.objects.active = active
+
+def batched_output(func):
+    """Buffer everything func prints and write it to stdout in one go.
+
+    Each print in Blender goes through its stdout capture; one write at the
+    end is cheaper. The output is still written if func raises.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        buffer = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(buffer):
+                return func(*args, **kwargs)
+        finally:
+            sys.stdout.write(buffer.getvalue())
+            sys.stdout.flush()
+    return wrapper
 
 def export_orbital_mesh(obj, filepath, format='OBJ'):
     """
@@ -379,9 +962,7 @@ def export_orbital_mesh(obj, filepath, format='OBJ'):
         raise RuntimeError("Blender not available. Cannot export mesh.")
 
     # Select only this object
-    bpy.ops.object.select_all(action='DESELECT')
-    obj.select_set(True)
-    bpy.context.view_layer.objects.active = obj
+    select_objects([obj], active=obj)
 
     # Export based on format
     if format.upper() == 'OBJ':
@@ -412,6 +993,15 @@ def create_example_orbitals():
         (2, 1, 1),  # 2px
         (3, 2, 0),  # 3dz²
     ]
+    resolution = 64
+
+    # The orbitals are independent, so their density grids are evaluated
+    # concurrently (numpy/scipy release the GIL) into cached_density_grid,
+    # where create_orbital_mesh finds them; Blender calls stay on this thread
+    with ThreadPoolExecutor(max_workers=len(orbitals)) as executor:
+        list(executor.map(
+            lambda nlm: cached_density_grid(*nlm, resolution=resolution), orbitals
+        ))
 
     all_objects = []
     x_offset = 0
@@ -419,11 +1009,8 @@ def create_example_orbitals():
     for n, l, m in orbitals:
         print(f"Creating {get_orbital_name(n, l, m)} orbital...")
 
-        objects = create_orbital_mesh(n, l, m, resolution=64)
-
         # Offset in X for layout
-        for obj in objects:
-            obj.location.x += x_offset
+        objects = create_orbital_mesh(n, l, m, resolution=resolution, location=(x_offset, 0, 0))
 
         all_objects.extend(objects)
         x_offset += 50  # Spacing in Bohr radii
@@ -437,25 +1024,26 @@ def create_bloch_sphere_states():
         print("Blender not available.")
         return
 
-    states = ['|0⟩', '|1⟩', '|+⟩', '|-⟩', '|+i⟩', '|-i⟩']
+    state_names = ['|0⟩', '|1⟩', '|+⟩', '|-⟩', '|+i⟩', '|-i⟩']
+    states = [create_state(state_name, basis='sp') for state_name in state_names]
+
+    # Fill each state's density cache concurrently; the mesh step below
+    # reuses it and keeps the Blender calls on this thread
+    with ThreadPoolExecutor(max_workers=len(states)) as executor:
+        list(executor.map(lambda state: state.calculate_density_grid(), states))
 
     all_objects = []
     x_offset = 0
 
-    for state_name in states:
+    for state_name, state in zip(state_names, states):
         print(f"Creating {state_name} state...")
 
-        state = create_state(state_name, basis='sp')
-        objects = create_bloch_state_mesh(
-            state.theta, state.phi,
-            basis='sp',
-            name=state_name.strip('⟩').strip('|')
+        objects = _create_state_mesh(
+            state, 'sp',
+            name=state_name.strip('⟩').strip('|'),
+            location=(x_offset, 0, 0)  # Offset in X
         )
 
-        # Offset in X
-        for obj in objects:
-            obj.location.x += x_offset
-
         all_objects.extend(objects)
         x_offset += 40
 
@@ -5,27 +5,165 @@ Provides a unified interface for working with quantum states represented
 as both Bloch sphere coordinates and hydrogen orbital superpositions.
 """
 
+import functools
+from collections import OrderedDict
+
 import numpy as np
 from .quantum_constants import (
+    BLOCH_PURE_STATES,
     DEFAULT_GRID_RESOLUTION,
     get_orbital_extent,
     get_orbital_name,
 )
 from .hydrogen_wavefunctions import (
+    cartesian_to_spherical,
+    dense_coordinate_grids,
     hydrogen_orbital,
     probability_density,
+    real_orbital_table,
     calculate_density_grid,
 )
 from .orbital_coefficients import (
     bloch_to_state_vector,
     state_vector_to_bloch,
-    bloch_to_orbital_coeffs,
+    bloch_to_orbital_arrays,
+    mix_orbital_density,
     orbital_coeffs_to_density,
+    orbital_workspace,
     apply_gate_to_bloch,
     apply_gate_to_orbitals,
+    apply_circuit_to_state,
     analyze_superposition,
 )
 
+# ============================================================================
+# Shared Grids
+# ============================================================================
+
+@functools.lru_cache(maxsize=4)
+def _build_grid(resolution, extent):
+    """
+    Build the sparse coordinate grid and its spherical coordinates.
+
+    The grid depends only on (resolution, extent), not on the state, so it
+    is shared by every state and survives gate applications. r and theta
+    are full N³ arrays, which is why only a few grids are kept.
+
+    Args:
+        resolution: Grid resolution (points per axis)
+        extent: Spatial extent in Bohr radii
+
+    Returns:
+        tuple: (x_grid, y_grid, z_grid, r, theta, phi) read-only arrays
+    """
+    axis = np.linspace(-extent, extent, resolution)
+    x_grid, y_grid, z_grid = np.meshgrid(axis, axis, axis, indexing='ij', sparse=True)
+    grid = (x_grid, y_grid, z_grid) + cartesian_to_spherical(x_grid, y_grid, z_grid)
+
+    for arr in grid:
+        arr.setflags(write=False)
+
+    return grid
+
+@functools.lru_cache(maxsize=4)
+def _basis_table(orbitals, resolution, extent, dtype):
+    """
+    Get the (K, N³) table of basis orbital values on the shared grid.
+
+    Row k holds the k-th orbital of orbitals, flattened. The table only
+    depends on the basis and the grid, so every state with the same basis
+    (e.g. the six from create_bloch_sphere_states) shares one read-only
+    copy, kept across gates and state changes.
+
+    Args:
+        orbitals: Tuple of (n, l, m) tuples, in coefficient order
+        resolution: Grid resolution
+        extent: Spatial extent in Bohr radii
+        dtype: Storage np.dtype, or None (complex rows use the complex
+            counterpart)
+
+    Returns:
+        np.array: Orbital values, one flattened row per basis orbital
+    """
+    _, _, _, r, theta, phi = _build_grid(resolution, extent)
+
+    table = np.stack([
+        np.broadcast_to(psi, r.shape).ravel()
+        for psi in real_orbital_table(orbitals, r, theta, phi)
+    ])
+
+    if dtype is not None:
+        if np.iscomplexobj(table):
+            dtype = np.result_type(dtype, np.complex64)
+        table = table.astype(dtype, copy=False)
+
+    table.flags.writeable = False
+    return table
+
+# Gates that only shift the relative phase of |1⟩, by angle
+_PHASE_GATE_ANGLES = {
+    'I': 0.0,
+    'Z': np.pi,
+    'S': np.pi / 2,
+    'T': np.pi / 4,
+}
+
+# Named pure states as conjugated rows, so that _PURE_STATE_MATRIX @ ψ
+# gives the overlaps ⟨pure|ψ⟩ with every named state at once
+_PURE_STATE_LABELS = list(BLOCH_PURE_STATES)
+_PURE_STATE_MATRIX = np.conj([
+    bloch_to_state_vector(info['theta'], info['phi'])
+    for info in BLOCH_PURE_STATES.values()
+])
+
+# Density grid memo: angle quantum (radians) and number of grids kept
+_DENSITY_ANGLE_QUANTUM = 1e-6
+_DENSITY_MEMO_SIZE = 8
+
+def _phase_gate_angle(gate):
+    """
+    Get the Bloch sphere z rotation performed by a phase-only gate.
+
+    Args:
+        gate: Gate name or matrix
+
+    Returns:
+        float: Rotation angle, or None if gate is not a named phase gate
+    """
+    if not isinstance(gate, str):
+        return None
+
+    if gate.startswith('RZ('):
+        return float(gate[3:-1])
+
+    return _PHASE_GATE_ANGLES.get(gate)
+
+@functools.lru_cache(maxsize=64)
+def _slice_workspace(orbitals, plane, position, resolution, extent):
+    """Cached orbital workspace on a 2D slice (see orbital_workspace)."""
+    # Sparse 2D grid for the density evaluation
+    coord = np.linspace(-extent, extent, resolution)
+    c1, c2 = np.meshgrid(coord, coord, indexing='ij', sparse=True)
+
+    # Map to 3D coordinates based on plane
+    if plane == 'xy':
+        x, y, z = c1, c2, position
+    elif plane == 'xz':
+        x, y, z = c1, position, c2
+    else:  # 'yz'
+        x, y, z = position, c1, c2
+
+    table, shape = orbital_workspace(orbitals, x, y, z)
+    table.flags.writeable = False
+    return table, shape
+
+def _with_dense_coords(grid_result, return_dense):
+    """Expand the coordinate grids of a (x, y, z, values) result if requested."""
+    if not return_dense:
+        return grid_result
+
+    return (*dense_coordinate_grids(*grid_result[:3]), grid_result[3])
+
 # ============================================================================
 # Main Bloch Orbital State Class
 # ============================================================================
@@ -46,7 +184,8 @@ class BlochOrbitalState:
         phi (float): Bloch sphere azimuthal angle (0 to 2π)
         basis (str): Orbital basis ('sp', 'pp', or 'sd')
         state_vector (np.array): Complex state vector [α, β]
-        orbital_coeffs (dict): Orbital mixture coefficients
+        orbital_coeffs (dict): Orbital mixture coefficients (stored internally
+            as parallel _nlm / _coeffs arrays)
     """
 
     def __init__(self, theta=0.0, phi=0.0, basis='sp'):
@@ -62,8 +201,12 @@ class BlochOrbitalState:
         self._theta = 0.0
         self._phi = 0.0
         self._state_vector = np.array([1.0, 0.0], dtype=complex)
-        self._orbital_coeffs = {}
+        self._nlm = np.zeros((0, 3), dtype=np.int8)
+        self._coeffs = np.zeros(0, dtype=complex)
+        self._coeff_dict = None
+        self._state_gen = 0
         self._density_cache = None
+        self._density_memo = OrderedDict()
 
         # Set initial state
         self.set_bloch_state(theta, phi)
@@ -88,6 +231,17 @@ class BlochOrbitalState:
         """Orbital mixture coefficients."""
         return self._orbital_coeffs.copy()
 
+    @property
+    def _orbital_coeffs(self):
+        """Coefficient dict, rebuilt from the _nlm/_coeffs arrays on demand."""
+        if self._coeff_dict is None:
+            self._coeff_dict = dict(zip(self._orbital_keys(), self._coeffs.tolist()))
+        return self._coeff_dict
+
+    def _orbital_keys(self):
+        """(n, l, m) tuples of the basis orbitals, as Python ints."""
+        return [tuple(nlm) for nlm in self._nlm.tolist()]
+
     # ========================================================================
     # State Setting Methods
     # ========================================================================
@@ -103,8 +257,8 @@ class BlochOrbitalState:
         self._theta = theta
         self._phi = phi
         self._state_vector = bloch_to_state_vector(theta, phi)
-        self._orbital_coeffs = bloch_to_orbital_coeffs(theta, phi, self.basis)
-        self._density_cache = None  # Invalidate cache
+        self._set_orbital_arrays(*bloch_to_orbital_arrays(theta, phi, self.basis))
+        self._state_gen += 1  # Invalidate cache
 
     def set_state_vector(self, state_vector):
         """
@@ -120,8 +274,25 @@ class BlochOrbitalState:
 
         self._state_vector = state_vector
         self._theta, self._phi = state_vector_to_bloch(state_vector)
-        self._orbital_coeffs = bloch_to_orbital_coeffs(self._theta, self._phi, self.basis)
-        self._density_cache = None
+        self._set_orbital_arrays(*bloch_to_orbital_arrays(self._theta, self._phi, self.basis))
+        self._state_gen += 1
+
+    def _set_orbital_arrays(self, nlm, coeffs):
+        """
+        Store orbital coefficients as parallel (K, 3) quantum number and (K,)
+        coefficient arrays.
+
+        The arrays let coefficient scans (dominant orbital, probabilities,
+        density mixing) run as single vectorized operations; the dict form
+        is only rebuilt when asked for.
+
+        Args:
+            nlm: (K, 3) int8 quantum numbers (as from bloch_to_orbital_arrays)
+            coeffs: (K,) orbital coefficients
+        """
+        self._nlm = nlm
+        self._coeffs = np.array(coeffs, dtype=complex)
+        self._coeff_dict = None
 
     def set_pure_state(self, state_name):
         """
@@ -130,8 +301,6 @@ class BlochOrbitalState:
         Args:
             state_name: Name of state ('|0⟩', '|1⟩', '|+⟩', '|-⟩', '|+i⟩', '|-i⟩')
         """
-        from .quantum_constants import BLOCH_PURE_STATES
-
         if state_name not in BLOCH_PURE_STATES:
             raise ValueError(f"Unknown state: {state_name}")
 
@@ -158,16 +327,9 @@ class BlochOrbitalState:
         Returns:
             tuple: ((n, l, m), coefficient) for dominant orbital
         """
-        max_coeff = 0.0
-        dominant = None
-
-        for nlm, coeff in self._orbital_coeffs.items():
-            mag = np.abs(coeff)
-            if mag > max_coeff:
-                max_coeff = mag
-                dominant = (nlm, coeff)
+        i = int(np.argmax(np.abs(self._coeffs)))
 
-        return dominant
+        return tuple(self._nlm[i].tolist()), self._coeffs[i]
 
     def get_orbital_probabilities(self):
         """
@@ -176,55 +338,123 @@ class BlochOrbitalState:
         Returns:
             dict: Mapping from (n, l, m) to probability
         """
-        probs = {}
-        for nlm, coeff in self._orbital_coeffs.items():
-            probs[nlm] = np.abs(coeff) ** 2
+        probs = np.abs(self._coeffs) ** 2
+
+        return dict(zip(self._orbital_keys(), probs))
+
+    def get_probability_array(self, orbitals=None):
+        """
+        Get orbital probabilities as an array aligned with the given orbitals.
 
-        return probs
+        Args:
+            orbitals: Optional sequence of (n, l, m) tuples (default: the
+                basis orbitals, in coefficient order)
+
+        Returns:
+            np.array: Probability of each orbital (0 for orbitals outside
+                the basis)
+        """
+        probs = np.abs(self._coeffs) ** 2
+        if orbitals is None:
+            return probs
+
+        # (Q, K) match of the requested orbitals against the basis rows
+        query = np.asarray(orbitals, dtype=int).reshape(-1, 3)
+        matches = (query[:, None, :] == self._nlm[None, :, :]).all(axis=-1)
+
+        return matches @ probs
 
     # ========================================================================
     # Density Calculation Methods
     # ========================================================================
 
-    def calculate_density_grid(self, resolution=None, extent=None, use_cache=True):
+    def calculate_density_grid(self, resolution=None, extent=None, use_cache=True,
+                               dtype=np.float32, return_dense=False):
         """
         Generate 3D probability density grid for current state.
 
         Args:
             resolution: Grid resolution (default: from constants)
             extent: Spatial extent in Bohr radii (default: auto from n)
-            use_cache: Use cached grid if available
+            use_cache: Reuse a cached grid for the same state and grid
+                parameters if available
+            dtype: Storage dtype of the density grid (None keeps float64);
+                the orbital table is stored (and mixed) at the same precision
+            return_dense: Return full N³ coordinate grids instead of
+                sparse ones
 
         Returns:
-            tuple: (x_grid, y_grid, z_grid, density_grid)
+            tuple: (x_grid, y_grid, z_grid, density_grid) where the
+                coordinate grids are sparse (broadcastable) meshgrids
+                unless return_dense is set
         """
-        if use_cache and self._density_cache is not None:
-            return self._density_cache
-
         if resolution is None:
             resolution = DEFAULT_GRID_RESOLUTION
 
         if extent is None:
             # Use extent based on highest n value
-            max_n = max(nlm[0] for nlm in self._orbital_coeffs.keys())
+            max_n = int(self._nlm[:, 0].max())
             extent = get_orbital_extent(max_n)
 
-        # Create grid
-        x = np.linspace(-extent, extent, resolution)
-        y = np.linspace(-extent, extent, resolution)
-        z = np.linspace(-extent, extent, resolution)
-        x_grid, y_grid, z_grid = np.meshgrid(x, y, z, indexing='ij')
+        grid_key = (resolution, extent, dtype)
+        if use_cache:
+            cached = self._cached_density(grid_key)
+            if cached is not None:
+                return _with_dense_coords(cached, return_dense)
 
-        # Calculate density from orbital mixture
-        density_grid = orbital_coeffs_to_density(
-            self._orbital_coeffs,
-            x_grid, y_grid, z_grid
-        )
+        # Shared sparse grid; the orbital values on it are tabulated once
+        x_grid, y_grid, z_grid, r, theta, phi = _build_grid(resolution, extent)
+        table = _basis_table(tuple(self._orbital_keys()), resolution, extent,
+                             None if dtype is None else np.dtype(dtype))
+
+        # Mix the orbitals: ρ = |Σ c_k ψ_k|², at the table's precision
+        density_grid = mix_orbital_density(self._coeffs, table).reshape(r.shape)
 
         # Cache result
-        self._density_cache = (x_grid, y_grid, z_grid, density_grid)
+        result = (x_grid, y_grid, z_grid, density_grid)
+        self._store_density(grid_key, result)
+
+        return _with_dense_coords(result, return_dense)
+
+    def _density_memo_key(self, grid_key):
+        """
+        Memo key for the current state on a given grid.
+
+        The Bloch angles are quantized so that states reached along
+        different gate paths (H·H, X·X, a full rotation) share an entry.
+        """
+        theta_q = int(round(self._theta / _DENSITY_ANGLE_QUANTUM))
+        phi_q = int(round((self._phi % (2 * np.pi)) / _DENSITY_ANGLE_QUANTUM))
+        return (theta_q, phi_q, self.basis) + grid_key
+
+    def _cached_density(self, grid_key):
+        """
+        Look up a cached density grid, or None on a miss.
+
+        The last result is checked first against the state generation, so
+        repeated calls without a state change skip the memo entirely.
+        """
+        if self._density_cache is not None:
+            gen, key, result = self._density_cache
+            if gen == self._state_gen and key == grid_key:
+                return result
+
+        memo_key = self._density_memo_key(grid_key)
+        result = self._density_memo.get(memo_key)
+        if result is None:
+            return None
+
+        self._density_memo.move_to_end(memo_key)
+        self._density_cache = (self._state_gen, grid_key, result)
+        return result
+
+    def _store_density(self, grid_key, result):
+        """Record a density grid as the last result and in the LRU memo."""
+        self._density_cache = (self._state_gen, grid_key, result)
 
-        return self._density_cache
+        self._density_memo[self._density_memo_key(grid_key)] = result
+        while len(self._density_memo) > _DENSITY_MEMO_SIZE:
+            self._density_memo.popitem(last=False)
 
     def calculate_slice(self, plane='xy', position=0.0, resolution=None, extent=None):
         """
@@ -243,25 +473,19 @@ class BlochOrbitalState:
             resolution = DEFAULT_GRID_RESOLUTION
 
         if extent is None:
-            max_n = max(nlm[0] for nlm in self._orbital_coeffs.keys())
+            max_n = int(self._nlm[:, 0].max())
             extent = get_orbital_extent(max_n)
 
-        # Create 2D grid
-        coord = np.linspace(-extent, extent, resolution)
-        c1, c2 = np.meshgrid(coord, coord, indexing='ij')
-
-        # Map to 3D coordinates based on plane
-        if plane == 'xy':
-            x, y, z = c1, c2, position
-        elif plane == 'xz':
-            x, y, z = c1, position, c2
-        elif plane == 'yz':
-            x, y, z = position, c1, c2
-        else:
+        if plane not in ('xy', 'xz', 'yz'):
             raise ValueError(f"Unknown plane: {plane}")
 
-        # Calculate density
-        density = orbital_coeffs_to_density(self._orbital_coeffs, x, y, z)
+        # Calculate density; the orbitals on the slice are reused across states
+        workspace = _slice_workspace(tuple(self._orbital_keys()), plane, position,
+                                     resolution, extent)
+        density = orbital_coeffs_to_density(self._orbital_coeffs, workspace=workspace)
+
+        coord = np.linspace(-extent, extent, resolution)
+        c1, c2 = np.meshgrid(coord, coord, indexing='ij')
 
         return c1, c2, density
 
@@ -279,6 +503,13 @@ class BlochOrbitalState:
         Returns:
             BlochOrbitalState: self (for method chaining)
         """
+        # Phase gates only rotate phi, which cannot be recovered from the
+        # state vector at the poles; those fall through to the general path
+        phase = _phase_gate_angle(gate_type)
+        if phase is not None and np.abs(self._state_vector[1]) > 0:
+            self._apply_phase(phase)
+            return self
+
         # Apply gate to Bloch coordinates
         new_theta, new_phi = apply_gate_to_bloch(self._theta, self._phi, gate_type)
 
@@ -287,6 +518,31 @@ class BlochOrbitalState:
 
         return self
 
+    def _apply_phase(self, angle):
+        """
+        Rotate the state about the Bloch sphere z axis.
+
+        theta is unchanged, so the existing coefficients are updated in
+        place instead of being rebuilt: the |1⟩ orbital picks up e^(i·angle)
+        ('sp', 'sd'), or the px/py pair rotates with phi ('pp').
+
+        Args:
+            angle: Rotation angle in radians
+        """
+        self._phi = (self._phi + angle) % (2 * np.pi)
+
+        phase = np.exp(1j * angle)
+        self._state_vector[1] *= phase
+
+        if self.basis == 'pp':
+            self._set_orbital_arrays(*bloch_to_orbital_arrays(self._theta, self._phi, self.basis))
+        else:
+            self._coeffs[1] *= phase
+            self._coeff_dict = None
+
+        # The relative phase changes the interference pattern
+        self._state_gen += 1
+
     def apply_rotation(self, axis, angle):
         """
         Apply rotation gate around specified axis.
@@ -301,6 +557,24 @@ class BlochOrbitalState:
         gate_name = f"R{axis.upper()}({angle})"
         return self.apply_gate(gate_name)
 
+    def apply_gates(self, gates):
+        """
+        Apply a gate sequence as one fused matrix product.
+
+        The state is rebuilt once for the whole sequence instead of once
+        per gate; named sequences reuse a cached composed matrix.
+
+        Args:
+            gates: Sequence of gate names and/or 2x2 matrices, in the order
+                they are applied
+
+        Returns:
+            BlochOrbitalState: self (for method chaining)
+        """
+        self.set_state_vector(apply_circuit_to_state(self._state_vector, gates))
+
+        return self
+
     # ========================================================================
     # Analysis Methods
     # ========================================================================
@@ -328,14 +602,18 @@ class BlochOrbitalState:
         """
         Calculate Bloch vector components (x, y, z).
 
+        The state vector already holds the half-angle terms cos(θ/2) and
+        e^(iφ)·sin(θ/2), so ⟨X⟩, ⟨Y⟩, ⟨Z⟩ follow from the double-angle
+        identities without any further trig calls.
+
         Returns:
-            np.array: Bloch vector [x, y, z]
+            np.array: Bloch vector [x, y, z] = [⟨X⟩, ⟨Y⟩, ⟨Z⟩]
         """
-        x = np.sin(self._theta) * np.cos(self._phi)
-        y = np.sin(self._theta) * np.sin(self._phi)
-        z = np.cos(self._theta)
+        alpha, beta = self._state_vector
+        coherence = 2 * np.conj(alpha) * beta  # sin θ · e^(iφ)
+        z = abs(alpha) ** 2 - abs(beta) ** 2   # cos θ
 
-        return np.array([x, y, z])
+        return np.array([coherence.real, coherence.imag, z])
 
     def measure_expectation(self, observable):
         """
@@ -350,6 +628,20 @@ class BlochOrbitalState:
         expectation = np.conj(self._state_vector) @ observable @ self._state_vector
         return np.real(expectation)
 
+    def measure_expectations(self, observables):
+        """
+        Calculate expectation values of a stack of observables at once.
+
+        Args:
+            observables: (K, 2, 2) array of observables
+
+        Returns:
+            np.array: (K,) expectation values ⟨ψ|O_k|ψ⟩
+        """
+        psi = self._state_vector
+        expectations = np.einsum('kij,i,j->k', observables, np.conj(psi), psi)
+        return expectations.real
+
     # ========================================================================
     # Visualization Helper Methods
     # ========================================================================
@@ -364,10 +656,11 @@ class BlochOrbitalState:
         Returns:
             list: Absolute density values for isosurfaces
         """
-        if self._density_cache is None:
-            self.calculate_density_grid()
-
-        _, _, _, density = self._density_cache
+        # Prefer the grid last computed for this state, whatever its resolution
+        if self._density_cache is not None and self._density_cache[0] == self._state_gen:
+            _, _, _, density = self._density_cache[2]
+        else:
+            _, _, _, density = self.calculate_density_grid()
         max_density = np.max(density)
 
         return [frac * max_density for frac in fractions]
@@ -400,24 +693,13 @@ class BlochOrbitalState:
 
     def _get_state_label(self):
         """Generate human-readable state label."""
-        alpha, beta = self._state_vector
+        # Fidelity |⟨pure|ψ⟩|² with each named pure state
+        overlaps = np.abs(_PURE_STATE_MATRIX @ self._state_vector) ** 2
 
         # Check if close to pure state
-        if np.abs(alpha) > 0.99:
-            return "|0⟩"
-        elif np.abs(beta) > 0.99:
-            return "|1⟩"
-        elif np.abs(np.abs(alpha) - np.abs(beta)) < 0.01:
-            # Superposition state
-            phase = np.angle(beta) - np.angle(alpha)
-            if np.abs(phase) < 0.1:
-                return "|+⟩"
-            elif np.abs(phase - np.pi) < 0.1:
-                return "|-⟩"
-            elif np.abs(phase - np.pi / 2) < 0.1:
-                return "|+i⟩"
-            elif np.abs(phase + np.pi / 2) < 0.1:
-                return "|-i⟩"
+        closest = int(np.argmax(overlaps))
+        if overlaps[closest] > 0.98:
+            return _PURE_STATE_LABELS[closest]
 
         # General superposition
         return f"α|0⟩ + β|1⟩"
@@ -444,7 +726,7 @@ class BlochOrbitalState:
             f"  State: {state_str}\n"
             f"  Bloch: θ={self._theta:.3f}, φ={self._phi:.3f}\n"
             f"  Basis: {self.basis}\n"
-            f"  Orbitals: {len(self._orbital_coeffs)}\n"
+            f"  Orbitals: {len(self._nlm)}\n"
             f")"
         )
 
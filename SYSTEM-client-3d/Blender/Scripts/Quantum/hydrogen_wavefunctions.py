@@ -5,11 +5,15 @@ Implements radial wave functions, spherical harmonics, and complete
 hydrogen orbital wave functions with proper normalization.
 """
 
+import functools
+import math
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from scipy import special
-from scipy.integrate import tplquad
 from .quantum_constants import (
     BOHR_RADIUS,
+    MAX_PRINCIPAL_QUANTUM_NUMBER,
+    get_orbital_extent,
     validate_quantum_numbers,
     RADIAL_NORMALIZATION,
 )
@@ -18,6 +22,21 @@ from .quantum_constants import (
 # Radial Wave Functions
 # ============================================================================
 
+def _radial_norm(n, l):
+    """Normalization constant sqrt((2/n)³ * (n-l-1)! / (2n * (n+l)!))."""
+    return math.sqrt(
+        (2.0 / n) ** 3 *
+        math.factorial(n - l - 1) /
+        (2.0 * n * math.factorial(n + l))
+    )
+
+# Radial normalization constants, precomputed for n up to the supported maximum
+_RADIAL_NORM = {
+    (n, l): _radial_norm(n, l)
+    for n in range(1, MAX_PRINCIPAL_QUANTUM_NUMBER + 1)
+    for l in range(n)
+}
+
 def generalized_laguerre(n, alpha, x):
     """
     Calculate generalized Laguerre polynomial L_n^alpha(x).
@@ -54,39 +73,61 @@ def radial_wavefunction(n, l, r):
     # Convert to numpy array for vectorized operations
     r = np.asarray(r, dtype=float)
 
-    # Avoid division by zero and numerical issues at r=0
-    # For l>0, R_nl(0) = 0. For l=0, we use limit value
-    r_safe = np.where(r > 0, r, 1e-10)
+    rho, envelope = _radial_envelope(n, r)
+
+    return _radial_from_envelope(n, l, rho, envelope)
+
+def _radial_envelope(n, r):
+    """
+    Dimensionless radius rho = 2r/n and exponential exp(-rho/2) for shell n.
+
+    Both only depend on n, so orbitals of one shell can share them.
+    """
+    # Clamp r away from zero instead of patching r=0 afterwards: the
+    # formula then gives R_nl(0) = 0 for l>0 (through rho^l) and the
+    # finite limit for l=0
+    r_safe = np.maximum(r, 1e-12)
 
     # Dimensionless radial coordinate
     rho = 2.0 * r_safe / n
 
+    # Exponential term
+    return rho, np.exp(-0.5 * rho)
+
+def _radial_from_envelope(n, l, rho, R_nl, scale=1.0):
+    """
+    Finish R_nl(r) in place from the (writable) exponential term.
+
+    Args:
+        n, l: Quantum numbers
+        rho: Dimensionless radius from _radial_envelope
+        R_nl: Exponential term buffer, overwritten with R_nl
+        scale: Constant factor folded into the normalization pass (e.g. a
+            constant angular factor)
+
+    Returns:
+        R_nl(r): Radial wave function value(s), times scale
+    """
     # Normalization constant
     # N = sqrt((2/n)³ * (n-l-1)! / (2n * (n+l)!))
-    norm_factor = np.sqrt(
-        (2.0 / n) ** 3 *
-        special.factorial(n - l - 1) /
-        (2.0 * n * special.factorial(n + l))
-    )
+    norm_factor = _RADIAL_NORM.get((n, l))
+    if norm_factor is None:
+        norm_factor = _radial_norm(n, l)
 
-    # Exponential term
-    exp_term = np.exp(-rho / 2.0)
+    # The radial function is accumulated in place in one buffer rather
+    # than as separate exp/power/Laguerre grids.
 
     # Power term
-    power_term = rho ** l
+    if l > 0:
+        R_nl *= rho ** l
 
-    # Generalized Laguerre polynomial L_{n-l-1}^{2l+1}(rho)
-    laguerre_term = generalized_laguerre(n - l - 1, 2 * l + 1, rho)
+    # Generalized Laguerre polynomial L_{n-l-1}^{2l+1}(rho); L_0 = 1
+    # (l = n-1: 1s, 2p, 3d, ...) needs no pass
+    if n - l - 1 > 0:
+        R_nl *= generalized_laguerre(n - l - 1, 2 * l + 1, rho)
 
-    # Complete radial function
-    R_nl = norm_factor * exp_term * power_term * laguerre_term
-
-    # Handle r=0 case
-    if np.isscalar(r):
-        if r == 0:
-            R_nl = 0.0 if l > 0 else norm_factor
-    else:
-        R_nl = np.where(r > 0, R_nl, 0.0 if l > 0 else norm_factor)
+    # Normalization
+    R_nl *= norm_factor * scale
 
     return R_nl
 
@@ -94,6 +135,20 @@ def radial_wavefunction(n, l, r):
 # Spherical Harmonics
 # ============================================================================
 
+# Closed-form polar factors of the real spherical harmonics for l ≤ 2,
+# keyed by (l, |m|) and called as f(cos θ, sin θ). They include the
+# normalization, the Condon-Shortley phase and the √2 of the real form;
+# the azimuthal factor cos(|m|φ) (m > 0) or sin(|m|φ) (m < 0) is applied
+# by the caller. sin θ is only used (and may be None) when |m| > 0.
+_Y_LM_CLOSED_FORM = {
+    (0, 0): lambda ct, st: np.full_like(ct, 0.5 * math.sqrt(1 / math.pi)),
+    (1, 0): lambda ct, st: math.sqrt(3 / (4 * math.pi)) * ct,
+    (1, 1): lambda ct, st: -math.sqrt(3 / (4 * math.pi)) * st,
+    (2, 0): lambda ct, st: math.sqrt(5 / (16 * math.pi)) * (3 * ct * ct - 1),
+    (2, 1): lambda ct, st: -math.sqrt(15 / (4 * math.pi)) * ct * st,
+    (2, 2): lambda ct, st: math.sqrt(15 / (16 * math.pi)) * st * st,
+}
+
 def spherical_harmonic(l, m, theta, phi, real_form=True):
     """
     Calculate spherical harmonic Y_l^m(θ, φ).
@@ -108,28 +163,133 @@ def spherical_harmonic(l, m, theta, phi, real_form=True):
     Returns:
         Y_l^m(θ, φ): Complex or real spherical harmonic value(s)
     """
-    # scipy.special.sph_harm uses (m, l, phi, theta) convention
-    # and includes Condon-Shortley phase (-1)^m
-    Y_lm = special.sph_harm(m, l, phi, theta)
+    if real_form and (l, abs(m)) in _Y_LM_CLOSED_FORM:
+        theta, phi = np.asarray(theta), np.asarray(phi)
+        sin_theta = np.sin(theta) if m != 0 else None
+        Y_real = _Y_LM_CLOSED_FORM[(l, abs(m))](np.cos(theta), sin_theta)
+        if m > 0:
+            Y_real = Y_real * np.cos(m * phi)
+        elif m < 0:
+            Y_real = Y_real * np.sin(-m * phi)
+        return Y_real
 
+    # scipy.special.sph_harm uses (m, l, phi, theta) convention
+    # and includes Condon-Shortley phase (-1)^m. Each branch only
+    # evaluates the harmonics it needs
     if real_form and m != 0:
         # Convert to real form for visualization
-        # Real form: Y_l^m_real = (Y_l^m + (-1)^m * Y_l^{-m}*) / sqrt(2)  for m > 0
-        #            Y_l^m_real = (Y_l^m - (-1)^m * Y_l^{-m}*) / (i*sqrt(2))  for m < 0
+        # Real form: Y_l^m_real = (Y_l^m + (-1)^m * Y_l^{-m}*) / sqrt(2)    for m > 0
+        #            Y_l^m_real = (Y_l^|m| - Y_l^|m|*) / (i*sqrt(2))      for m < 0
+        # i.e. sqrt(2)*Re(Y_l^m) and sqrt(2)*Im(Y_l^|m|)
         if m > 0:
+            Y_lm = special.sph_harm(m, l, phi, theta)
             Y_lm_conj = special.sph_harm(-m, l, phi, theta)
             Y_real = (Y_lm + (-1) ** m * np.conj(Y_lm_conj)) / np.sqrt(2)
         else:  # m < 0
             Y_lm_pos = special.sph_harm(-m, l, phi, theta)
-            Y_real = (Y_lm - (-1) ** m * np.conj(Y_lm_pos)) / (1j * np.sqrt(2))
+            Y_real = (Y_lm_pos - np.conj(Y_lm_pos)) / (1j * np.sqrt(2))
         return np.real(Y_real)
 
-    return Y_lm
+    return special.sph_harm(m, l, phi, theta)
 
 # ============================================================================
 # Complete Hydrogen Wave Functions
 # ============================================================================
 
+def _legendre_norm(l, m):
+    """Spherical harmonic normalization sqrt((2l+1)/(4π) * (l-m)!/(l+m)!) for m ≥ 0."""
+    return math.sqrt(
+        (2 * l + 1) / (4 * math.pi) *
+        math.factorial(l - m) / math.factorial(l + m)
+    )
+
+def real_orbital_table(orbitals, r, theta, phi):
+    """
+    Evaluate several real-form hydrogen orbitals on one grid, sharing work.
+
+    Same values as hydrogen_orbital_spherical(..., real_form=True), but
+    R_nl is computed once per (n, l) (from an exponential shared by each
+    shell n), the associated Legendre factor
+    P_l^|m|(cos θ) once per (l, |m|) (closed form for l ≤ 2), and
+    cos(|m|φ), sin(|m|φ) once per |m|.
+    On sparse grids φ only spans the (N, N, 1) plane, so the azimuthal
+    tables are cheap.
+
+    Args:
+        orbitals: Sequence of (n, l, m) tuples
+        r, theta, phi: Spherical coordinates (as from cartesian_to_spherical)
+
+    Returns:
+        list: Real wave function array for each orbital, in order
+    """
+    r = np.asarray(r, dtype=float)
+    cos_theta = np.cos(theta)
+    sin_theta = None
+    envelopes, radial, legendre, azimuthal = {}, {}, {}, {}
+
+    values = []
+    for n, l, m in orbitals:
+        validate_quantum_numbers(n, l, m)
+        abs_m = abs(m)
+
+        if (n, l) not in radial:
+            if n not in envelopes:
+                envelopes[n] = _radial_envelope(n, r)
+            rho, envelope = envelopes[n]
+            radial[(n, l)] = _radial_from_envelope(n, l, rho, envelope.copy())
+
+        if (l, abs_m) not in legendre:
+            if (l, abs_m) in _Y_LM_CLOSED_FORM:
+                if abs_m and sin_theta is None:
+                    sin_theta = np.sin(theta)
+                legendre[(l, abs_m)] = _Y_LM_CLOSED_FORM[(l, abs_m)](cos_theta, sin_theta)
+            else:
+                # lpmv includes the Condon-Shortley phase, like sph_harm
+                Y_theta = _legendre_norm(l, abs_m) * special.lpmv(abs_m, l, cos_theta)
+                legendre[(l, abs_m)] = np.sqrt(2) * Y_theta if abs_m else Y_theta
+
+        Y_lm = legendre[(l, abs_m)]
+        if m != 0:
+            if abs_m not in azimuthal:
+                azimuthal[abs_m] = (np.cos(abs_m * phi), np.sin(abs_m * phi))
+            cos_m_phi, sin_m_phi = azimuthal[abs_m]
+            Y_lm = Y_lm * (cos_m_phi if m > 0 else sin_m_phi)
+
+        values.append(radial[(n, l)] * Y_lm)
+
+    return values
+
+def hydrogen_orbitals_batched(orbitals, x, y, z, spherical=None):
+    """
+    Evaluate several real-form orbitals into one contiguous (K, ...) array.
+
+    The batched form of hydrogen_orbital: the coordinates are converted to
+    spherical once, and radial and angular factors are shared between the
+    orbitals (see real_orbital_table).
+
+    Args:
+        orbitals: Sequence (or (K, 3) array) of (n, l, m) quantum numbers
+        x, y, z: Cartesian coordinates (in Bohr radii, can be arrays)
+        spherical: Optional precomputed (r, theta, phi) for x, y, z
+
+    Returns:
+        np.array: (K, *shape) real wave function values, shape being the
+            broadcast shape of the coordinates
+    """
+    if spherical is None:
+        spherical = cartesian_to_spherical(x, y, z)
+    r, theta, phi = spherical
+
+    orbitals = [tuple(int(q) for q in nlm) for nlm in orbitals]
+    values = real_orbital_table(orbitals, r, theta, phi)
+
+    shape = np.broadcast_shapes(*(np.shape(psi) for psi in values))
+    table = np.empty((len(values),) + shape)
+    for row, psi in zip(table, values):
+        row[...] = psi
+
+    return table
+
 def cartesian_to_spherical(x, y, z):
     """
     Convert Cartesian coordinates to spherical coordinates.
@@ -145,8 +305,11 @@ def cartesian_to_spherical(x, y, z):
     """
     x, y, z = np.asarray(x), np.asarray(y), np.asarray(z)
 
-    r = np.sqrt(x ** 2 + y ** 2 + z ** 2)
-    theta = np.arccos(np.clip(z / np.maximum(r, 1e-10), -1, 1))
+    # On sparse grids the xy terms only broadcast to the (N, N, 1) plane;
+    # just r and theta are materialized over the full volume
+    rho_xy_sq = x ** 2 + y ** 2
+    r = np.sqrt(rho_xy_sq + z ** 2)
+    theta = np.arctan2(np.sqrt(rho_xy_sq), z)
     phi = np.arctan2(y, x)
 
     # Ensure phi is in [0, 2π]
@@ -171,11 +334,37 @@ def hydrogen_orbital(n, l, m, x, y, z, real_form=True):
     Returns:
         ψ_nlm(r, θ, φ): Wave function value(s) (complex or real)
     """
-    validate_quantum_numbers(n, l, m)
+    if l == 0 and real_form:
+        # s orbitals: Y_0^0 is a constant, so only r is needed (the arctan2
+        # passes of cartesian_to_spherical are skipped) and Y_0^0 is folded
+        # into the radial normalization
+        validate_quantum_numbers(n, l, m)
+        x, y, z = np.asarray(x), np.asarray(y), np.asarray(z)
+        rho, psi = _radial_envelope(n, np.sqrt(x ** 2 + y ** 2 + z ** 2))
+        return _radial_from_envelope(n, 0, rho, psi, scale=0.5 * math.sqrt(1 / math.pi))
 
     # Convert to spherical coordinates
     r, theta, phi = cartesian_to_spherical(x, y, z)
 
+    return hydrogen_orbital_spherical(n, l, m, r, theta, phi, real_form=real_form)
+
+def hydrogen_orbital_spherical(n, l, m, r, theta, phi, real_form=True):
+    """
+    Calculate hydrogen wave function from precomputed spherical coordinates.
+
+    Lets callers that evaluate several orbitals on one grid convert the
+    grid to spherical coordinates only once.
+
+    Args:
+        n, l, m: Quantum numbers
+        r, theta, phi: Spherical coordinates (as from cartesian_to_spherical)
+        real_form: If True, use real spherical harmonics
+
+    Returns:
+        ψ_nlm(r, θ, φ): Wave function value(s) (complex or real)
+    """
+    validate_quantum_numbers(n, l, m)
+
     # Calculate radial part
     R_nl = radial_wavefunction(n, l, r)
 
@@ -206,11 +395,50 @@ def probability_density(psi):
 # Normalization and Integration
 # ============================================================================
 
+def _spherical_quadrature(r_max, num_points):
+    """
+    Build a tensor-product Gauss-Legendre rule over the ball of radius r_max.
+
+    Args:
+        r_max: Radius of the integration volume
+        num_points: Number of nodes per dimension (r, θ, φ)
+
+    Returns:
+        tuple: (r, theta, phi, weights) where r, theta, phi are sparse
+            (broadcastable) node grids and weights are the per-axis
+            weights (w_r, w_theta, w_phi) including the r² sin(θ) Jacobian
+    """
+    nodes, weights = special.roots_legendre(num_points)
+
+    # Map [-1, 1] onto each integration interval
+    def rescale(upper):
+        return 0.5 * upper * (nodes + 1), 0.5 * upper * weights
+
+    r, w_r = rescale(r_max)
+    theta, w_theta = rescale(np.pi)
+    phi, w_phi = rescale(2 * np.pi)
+
+    # Jacobian for spherical coordinates: r² sin(θ)
+    w_r = w_r * r ** 2
+    w_theta = w_theta * np.sin(theta)
+
+    r_grid, theta_grid, phi_grid = np.meshgrid(r, theta, phi, indexing='ij', sparse=True)
+
+    return r_grid, theta_grid, phi_grid, (w_r, w_theta, w_phi)
+
+def _integrate_spherical(values, weights):
+    """Contract a grid of integrand values with the quadrature weights."""
+    w_r, w_theta, w_phi = weights
+    values = np.broadcast_to(values, (len(w_r), len(w_theta), len(w_phi)))
+
+    return float(np.einsum('i,j,k,ijk->', w_r, w_theta, w_phi, values))
+
 def verify_normalization(n, l, m, r_max=None, num_points=50):
     """
     Verify that wave function is normalized: ∫|ψ|²dV = 1
 
-    Uses numerical integration over spherical volume.
+    Uses Gauss-Legendre quadrature over the spherical volume, with the
+    wave function evaluated on all nodes in one vectorized call.
 
     Args:
         n, l, m: Quantum numbers
@@ -225,28 +453,13 @@ def verify_normalization(n, l, m, r_max=None, num_points=50):
     if r_max is None:
         r_max = 5 * n ** 2  # Extend to ~5n² Bohr radii
 
-    # Define integrand in spherical coordinates
-    def integrand(phi, theta, r):
-        # Convert to Cartesian for wave function
-        x = r * np.sin(theta) * np.cos(phi)
-        y = r * np.sin(theta) * np.sin(phi)
-        z = r * np.cos(theta)
-
-        psi = hydrogen_orbital(n, l, m, x, y, z, real_form=True)
-        # Jacobian for spherical coordinates: r² sin(θ)
-        return probability_density(psi) * r ** 2 * np.sin(theta)
-
-    # Integrate over full sphere
-    result, error = tplquad(
-        integrand,
-        0, r_max,           # r: 0 to r_max
-        0, np.pi,           # theta: 0 to π
-        0, 2 * np.pi,       # phi: 0 to 2π
-    )
+    r, theta, phi, weights = _spherical_quadrature(r_max, num_points)
+
+    psi = hydrogen_orbital_spherical(n, l, m, r, theta, phi, real_form=True)
 
-    return result
+    return _integrate_spherical(probability_density(psi), weights)
 
-def verify_orthogonality(n1, l1, m1, n2, l2, m2, r_max=None):
+def verify_orthogonality(n1, l1, m1, n2, l2, m2, r_max=None, num_points=50):
     """
     Verify orthogonality: ∫ψ₁*ψ₂dV = 0 for different states.
 
@@ -254,73 +467,128 @@ def verify_orthogonality(n1, l1, m1, n2, l2, m2, r_max=None):
         n1, l1, m1: Quantum numbers for first state
         n2, l2, m2: Quantum numbers for second state
         r_max: Maximum radius for integration
+        num_points: Number of integration points per dimension
 
     Returns:
         float: Integral value (should be close to 0 for orthogonal states)
     """
-    validate_quantum_numbers(n1, l1, m1)
-    validate_quantum_numbers(n2, l2, m2)
+    pair = ((n1, l1, m1), (n2, l2, m2))
 
-    if r_max is None:
-        r_max = 5 * max(n1, n2) ** 2
+    return verify_orthogonality_batch([pair], r_max=r_max, num_points=num_points)[0]
+
+def verify_orthogonality_batch(pairs, r_max=None, num_points=50):
+    """
+    Compute the overlap integrals ∫ψ₁*ψ₂dV of several orbital pairs.
 
-    def integrand(phi, theta, r):
-        x = r * np.sin(theta) * np.cos(phi)
-        y = r * np.sin(theta) * np.sin(phi)
-        z = r * np.cos(theta)
+    The quadrature rule is built once and each distinct orbital is
+    evaluated on it once (sharing radial and angular factors, see
+    real_orbital_table), so every pair only costs one contraction.
 
-        psi1 = hydrogen_orbital(n1, l1, m1, x, y, z, real_form=True)
-        psi2 = hydrogen_orbital(n2, l2, m2, x, y, z, real_form=True)
+    Args:
+        pairs: Sequence of ((n1, l1, m1), (n2, l2, m2)) pairs
+        r_max: Maximum radius for integration (default: 5*n² for the largest n)
+        num_points: Number of integration points per dimension
 
-        return psi1 * psi2 * r ** 2 * np.sin(theta)
+    Returns:
+        list: Overlap integral of each pair, in order
+    """
+    orbitals = list(dict.fromkeys(nlm for pair in pairs for nlm in pair))
 
-    result, error = tplquad(
-        integrand,
-        0, r_max,
-        0, np.pi,
-        0, 2 * np.pi,
-    )
+    if r_max is None:
+        r_max = 5 * max(n for n, _, _ in orbitals) ** 2
+
+    r, theta, phi, weights = _spherical_quadrature(r_max, num_points)
+
+    # real_orbital_table validates each orbital's quantum numbers
+    psis = dict(zip(orbitals, real_orbital_table(orbitals, r, theta, phi)))
 
-    return result
+    return [_integrate_spherical(psis[nlm1] * psis[nlm2], weights) for nlm1, nlm2 in pairs]
 
 # ============================================================================
 # Grid-Based Calculations
 # ============================================================================
 
-def calculate_orbital_grid(n, l, m, extent=None, resolution=64, real_form=True):
+def _as_grid_dtype(values, dtype):
+    """Cast grid values to dtype, or to its complex counterpart if complex."""
+    if dtype is None:
+        return values
+    if np.iscomplexobj(values):
+        dtype = np.result_type(dtype, np.complex64)
+    return values.astype(dtype, copy=False)
+
+def dense_coordinate_grids(x_grid, y_grid, z_grid):
     """
-    Calculate wave function on a 3D grid.
+    Materialize sparse coordinate grids as full N³ arrays.
 
     Args:
-        n, l, m: Quantum numbers
-        extent: Spatial extent in Bohr radii (default: based on n)
-        resolution: Grid resolution (points per axis)
-        real_form: Use real spherical harmonics
+        x_grid, y_grid, z_grid: Sparse (broadcastable) coordinate grids
 
     Returns:
-        tuple: (x_grid, y_grid, z_grid, psi_grid)
-            x_grid, y_grid, z_grid: Coordinate grids
-            psi_grid: Wave function values on grid
+        tuple: (x_grid, y_grid, z_grid) dense, writable arrays
+    """
+    return tuple(np.array(g) for g in np.broadcast_arrays(x_grid, y_grid, z_grid))
+
+def _real_form_density(psi, dtype):
     """
-    from .quantum_constants import get_orbital_extent
+    Calculate |ψ|² of a real-form orbital into a single buffer of dtype.
 
+    Real-form orbitals are real-valued; sph_harm only hands back m=0 as
+    complex with a zero imaginary part. Squaring straight into the output
+    avoids casting psi and then writing |ψ|² as a second grid.
+    """
+    if np.iscomplexobj(psi):
+        psi = psi.real
+
+    return np.square(psi, dtype=dtype)
+
+def _orbital_grid(n, l, m, extent, resolution):
+    """Build the sparse coordinate grid for an orbital (extent defaults from n)."""
     validate_quantum_numbers(n, l, m)
 
     if extent is None:
         extent = get_orbital_extent(n)
 
-    # Create 3D grid
+    # Create 3D grid (sparse: only the 1-D axes are stored, the wave
+    # function evaluation broadcasts them to the full N³ volume)
     x = np.linspace(-extent, extent, resolution)
     y = np.linspace(-extent, extent, resolution)
     z = np.linspace(-extent, extent, resolution)
-    x_grid, y_grid, z_grid = np.meshgrid(x, y, z, indexing='ij')
+
+    return np.meshgrid(x, y, z, indexing='ij', sparse=True)
+
+def calculate_orbital_grid(n, l, m, extent=None, resolution=64, real_form=True,
+                           dtype=np.float32, return_dense=False):
+    """
+    Calculate wave function on a 3D grid.
+
+    Args:
+        n, l, m: Quantum numbers
+        extent: Spatial extent in Bohr radii (default: based on n)
+        resolution: Grid resolution (points per axis)
+        real_form: Use real spherical harmonics
+        dtype: Storage dtype of psi_grid (complex values use the matching
+            complex type; None keeps the float64/complex128 result)
+        return_dense: Return full N³ coordinate grids instead of sparse ones
+
+    Returns:
+        tuple: (x_grid, y_grid, z_grid, psi_grid)
+            x_grid, y_grid, z_grid: Sparse coordinate grids (shapes (N,1,1),
+                (1,N,1), (1,1,N)) that broadcast against psi_grid, or
+                dense grids if return_dense is set
+            psi_grid: Wave function values on grid
+    """
+    x_grid, y_grid, z_grid = _orbital_grid(n, l, m, extent, resolution)
 
     # Calculate wave function on grid
     psi_grid = hydrogen_orbital(n, l, m, x_grid, y_grid, z_grid, real_form=real_form)
 
-    return x_grid, y_grid, z_grid, psi_grid
+    if return_dense:
+        x_grid, y_grid, z_grid = dense_coordinate_grids(x_grid, y_grid, z_grid)
+
+    return x_grid, y_grid, z_grid, _as_grid_dtype(psi_grid, dtype)
 
-def calculate_density_grid(n, l, m, extent=None, resolution=64):
+def calculate_density_grid(n, l, m, extent=None, resolution=64, dtype=np.float32,
+                           return_dense=False, max_workers=None):
     """
     Calculate probability density on a 3D grid.
 
@@ -328,20 +596,120 @@ def calculate_density_grid(n, l, m, extent=None, resolution=64):
         n, l, m: Quantum numbers
         extent: Spatial extent in Bohr radii (default: based on n)
         resolution: Grid resolution (points per axis)
+        dtype: Storage dtype of density_grid; single precision is plenty
+            for visualization (None keeps float64)
+        return_dense: Return full N³ coordinate grids instead of sparse ones
+        max_workers: If > 1, evaluate z-slabs of the grid on this many
+            threads (every grid point is independent and the numpy/scipy
+            ufuncs release the GIL)
 
     Returns:
         tuple: (x_grid, y_grid, z_grid, density_grid)
-            x_grid, y_grid, z_grid: Coordinate grids
+            x_grid, y_grid, z_grid: Sparse (broadcastable) coordinate grids,
+                or dense grids if return_dense is set
             density_grid: Probability density values |ψ|²
     """
-    x_grid, y_grid, z_grid, psi_grid = calculate_orbital_grid(
-        n, l, m, extent, resolution, real_form=True
-    )
+    x_grid, y_grid, z_grid = _orbital_grid(n, l, m, extent, resolution)
 
-    density_grid = probability_density(psi_grid)
+    if max_workers is not None and max_workers > 1:
+        density_grid = _parallel_density_grid(n, l, m, x_grid, y_grid, z_grid, dtype, max_workers)
+    else:
+        psi_grid = hydrogen_orbital(n, l, m, x_grid, y_grid, z_grid, real_form=True)
+        density_grid = _real_form_density(psi_grid, dtype)
+
+    if return_dense:
+        x_grid, y_grid, z_grid = dense_coordinate_grids(x_grid, y_grid, z_grid)
 
     return x_grid, y_grid, z_grid, density_grid
 
+@functools.lru_cache(maxsize=8)
+def cached_density_grid(n, l, m, extent=None, resolution=64):
+    """
+    Calculate a density grid once and share it between callers.
+
+    The grid only depends on these scalar parameters, so scripts re-run in
+    one Blender session (or different scripts showing the same orbital)
+    reuse the earlier result instead of re-evaluating the wave function.
+    The arrays are shared and therefore read-only; use
+    calculate_density_grid for a grid to modify in place.
+
+    Args:
+        n, l, m: Quantum numbers
+        extent: Spatial extent in Bohr radii (default: based on n)
+        resolution: Grid resolution (points per axis)
+
+    Returns:
+        tuple: (x_grid, y_grid, z_grid, density_grid) read-only arrays, as
+            from calculate_density_grid
+    """
+    grid = calculate_density_grid(n, l, m, extent=extent, resolution=resolution)
+
+    for arr in grid:
+        arr.setflags(write=False)
+
+    return grid
+
+def _parallel_density_grid(n, l, m, x_grid, y_grid, z_grid, dtype, max_workers):
+    """
+    Fill a density grid by evaluating z-slabs concurrently.
+
+    Each worker writes its own disjoint slab of the preallocated output.
+    """
+    resolution = z_grid.shape[2]
+    density_grid = np.empty(
+        (x_grid.shape[0], y_grid.shape[1], resolution),
+        dtype=np.float64 if dtype is None else dtype
+    )
+    slab_depth = -(-resolution // max_workers)
+
+    def fill(z_start):
+        z_stop = min(z_start + slab_depth, resolution)
+        psi_slab = hydrogen_orbital(
+            n, l, m, x_grid, y_grid, z_grid[:, :, z_start:z_stop], real_form=True
+        )
+        density_grid[:, :, z_start:z_stop] = _real_form_density(psi_slab, dtype)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(fill, range(0, resolution, slab_depth)))
+
+    return density_grid
+
+def iter_density_slabs(n, l, m, extent=None, resolution=64, slab_depth=16, dtype=np.float32):
+    """
+    Calculate probability density on a 3D grid one z-slab at a time.
+
+    Consecutive slabs share one z slice, so every grid cell lies entirely
+    inside one slab. Only a single (N, N, slab_depth + 1) slab is held in
+    memory, instead of the full N³ volume.
+
+    Args:
+        n, l, m: Quantum numbers
+        extent: Spatial extent in Bohr radii (default: based on n)
+        resolution: Grid resolution (points per axis)
+        slab_depth: Number of grid cells along z per slab
+        dtype: Storage dtype of the slabs (None keeps float64)
+
+    Yields:
+        tuple: (z_start, density_slab) where z_start is the z index of the
+            slab's first slice in the full grid
+    """
+    validate_quantum_numbers(n, l, m)
+
+    if extent is None:
+        extent = get_orbital_extent(n)
+
+    axis = np.linspace(-extent, extent, resolution)
+    x_grid, y_grid, _ = np.meshgrid(axis, axis, axis[:1], indexing='ij', sparse=True)
+
+    for z_start in range(0, max(resolution - 1, 1), slab_depth):
+        z_stop = min(z_start + slab_depth + 1, resolution)
+        z_grid = axis[z_start:z_stop].reshape(1, 1, -1)
+
+        psi_slab = hydrogen_orbital(n, l, m, x_grid, y_grid, z_grid, real_form=True)
+        density_slab = _real_form_density(psi_slab, dtype)
+
+        yield z_start, density_slab
+
 # ============================================================================
 # Special Orbital Functions
 # ============================================================================
@@ -5,15 +5,20 @@ Maps Bloch sphere quantum states to superpositions of hydrogen orbitals,
 providing coefficients for orbital mixing and state transformations.
 """
 
+import functools
+import sys
 import numpy as np
 from .quantum_constants import (
     BLOCH_PURE_STATES,
     BLOCH_EQUATORIAL_STATES,
-    QUANTUM_GATES,
+    GATE_INDEX,
+    GATE_TABLE,
+    IDENTITY,
     rotation_x,
     rotation_y,
     rotation_z,
 )
+from .hydrogen_wavefunctions import hydrogen_orbitals_batched
 
 # ============================================================================
 # Bloch Sphere to State Vector Conversion
@@ -68,6 +73,74 @@ def state_vector_to_bloch(state_vector):
 # Orbital Coefficient Mapping
 # ============================================================================
 
+def _basis_nlm(orbitals):
+    """Read-only (K, 3) quantum number table for a basis."""
+    nlm = np.array(orbitals, dtype=np.int8)
+    nlm.flags.writeable = False
+    return nlm
+
+# Basis orbitals (n, l, m), in coefficient order
+_SP_NLM = _basis_nlm([(1, 0, 0), (2, 0, 0)])               # 1s, 2s
+_PP_NLM = _basis_nlm([(2, 1, 1), (2, 1, -1), (2, 1, 0)])   # 2px, 2py, 2pz
+_SD_NLM = _basis_nlm([(1, 0, 0), (3, 2, 0)])               # 1s, 3dz²
+
+def _pp_coeffs(theta, phi):
+    """Real 2px, 2py, 2pz coefficients for Bloch angles ('pp' basis)."""
+    # Map to p orbitals using equatorial plane
+    # |0⟩ → 2pz (pointing up)
+    # Equator → 2px, 2py combinations
+    # |1⟩ → -2pz (pointing down)
+
+    # For p orbitals, we use real combinations
+    cos_half = np.cos(theta / 2)
+    sin_half = np.sin(theta / 2)
+
+    return np.array([
+        sin_half * np.cos(phi),  # 2px (real form, m=1)
+        sin_half * np.sin(phi),  # 2py (real form, m=-1)
+        cos_half,                # 2pz (m=0)
+    ])
+
+# Per-basis (orbital table, coefficient builder), resolved with one lookup.
+# 'sp': |0⟩ → 1s, |1⟩ → 2s; 'sd': |0⟩ → 1s, |1⟩ → 3dz² (coefficients are
+# the state vector itself); 'pp': real p orbital combinations
+_BASIS_BUILDERS = {
+    'sp': (_SP_NLM, bloch_to_state_vector),
+    'pp': (_PP_NLM, _pp_coeffs),
+    'sd': (_SD_NLM, bloch_to_state_vector),
+}
+_BASIS_KEYS = {basis: [tuple(nlm) for nlm in table.tolist()]
+               for basis, (table, _) in _BASIS_BUILDERS.items()}
+
+def bloch_to_orbital_arrays(theta, phi, basis='sp'):
+    """
+    Convert Bloch sphere angles to orbital coefficients as parallel arrays.
+
+    Same mapping as bloch_to_orbital_coeffs, without building a dict.
+    theta and phi may also be arrays (broadcast together) to map a whole
+    sweep of states at once.
+
+    Args:
+        theta: Polar angle(s) on Bloch sphere (0 to π)
+        phi: Azimuthal angle(s) on Bloch sphere (0 to 2π)
+        basis: Orbital basis to use ('sp', 'pp', 'sd')
+
+    Returns:
+        tuple: (nlm, coeffs) where nlm is a read-only (K, 3) int8 array of
+            quantum numbers and coeffs the (K,) coefficients (complex,
+            or real for 'pp'), or (K, *shape) for array angles
+    """
+    entry = _BASIS_BUILDERS.get(basis)
+    if entry is None:
+        raise ValueError(f"Unknown basis: {basis}. Use 'sp', 'pp', or 'sd'")
+
+    if np.ndim(theta) or np.ndim(phi):
+        # Every coefficient row must span the full sweep
+        theta, phi = np.broadcast_arrays(theta, phi)
+
+    nlm, builder = entry
+    return nlm, builder(theta, phi)
+
 def bloch_to_orbital_coeffs(theta, phi, basis='sp'):
     """
     Convert Bloch sphere angles to orbital mixture coefficients.
@@ -89,49 +162,76 @@ def bloch_to_orbital_coeffs(theta, phi, basis='sp'):
         dict: Orbital coefficients with quantum numbers as keys
             e.g., {(1,0,0): α, (2,0,0): β} for 'sp' basis
     """
-    # Get state vector
-    state_vec = bloch_to_state_vector(theta, phi)
-    alpha, beta = state_vec
-
-    if basis == 'sp':
-        # |0⟩ → 1s, |1⟩ → 2s
-        return {
-            (1, 0, 0): alpha,  # 1s
-            (2, 0, 0): beta,   # 2s
-        }
-
-    elif basis == 'pp':
-        # Map to p orbitals using equatorial plane
-        # |0⟩ → 2pz (pointing up)
-        # Equator → 2px, 2py combinations
-        # |1⟩ → -2pz (pointing down)
-
-        # For p orbitals, we use real combinations
-        cos_half = np.cos(theta / 2)
-        sin_half = np.sin(theta / 2)
-
-        # Components
-        c_px = sin_half * np.cos(phi)  # x component
-        c_py = sin_half * np.sin(phi)  # y component
-        c_pz = cos_half                # z component
-
-        return {
-            (2, 1, 1): c_px,   # 2px (real form, m=1)
-            (2, 1, -1): c_py,  # 2py (real form, m=-1)
-            (2, 1, 0): c_pz,   # 2pz (m=0)
-        }
-
-    elif basis == 'sd':
-        # |0⟩ → 1s, |1⟩ → 3dz²
-        return {
-            (1, 0, 0): alpha,  # 1s
-            (3, 2, 0): beta,   # 3dz²
-        }
+    _, coeffs = bloch_to_orbital_arrays(theta, phi, basis)
 
-    else:
-        raise ValueError(f"Unknown basis: {basis}. Use 'sp', 'pp', or 'sd'")
+    return dict(zip(_BASIS_KEYS[basis], coeffs))
 
-def orbital_coeffs_to_density(coeffs, x, y, z):
+def orbital_workspace(orbitals, x, y, z, spherical=None):
+    """
+    Tabulate real-form orbitals into one contiguous (K, N) workspace.
+
+    The workspace only depends on the orbitals and the points, so it can be
+    kept and reused by orbital_coeffs_to_density for any coefficients.
+
+    Args:
+        orbitals: Sequence of (n, l, m) tuples
+        x, y, z: Spatial coordinates (in Bohr radii, can be arrays)
+        spherical: Optional precomputed (r, theta, phi) for x, y, z
+
+    Returns:
+        tuple: (table, shape) where row k of table is orbital k flattened
+            from the broadcast point shape
+    """
+    # One conversion and shared radial/angular factors for all orbitals
+    table = hydrogen_orbitals_batched(orbitals, x, y, z, spherical)
+    shape = table.shape[1:]
+
+    return table.reshape(len(table), -1), shape
+
+def mix_orbital_density(weights, table):
+    """
+    Probability density |Σ_k c_k ψ_k|² of a mixture of real orbitals.
+
+    Two-orbital mixtures (every basis but 'pp') use the expanded form
+    |c1|²ψ1² + |c2|²ψ2² + 2·Re(c1·c2*)·ψ1ψ2, a fused elementwise pass over
+    both rows with no complex temporaries. Larger mixtures use one
+    matrix-vector product per real/imaginary part of the coefficients.
+    Either way the real table is never promoted to complex, and the result
+    keeps the table's precision.
+
+    Args:
+        weights: (K,) complex coefficients
+        table: (K, N) real orbital values (as from orbital_workspace)
+
+    Returns:
+        np.array: (N,) probability density
+    """
+    if len(weights) == 2:
+        c1, c2 = complex(weights[0]), complex(weights[1])
+        psi1, psi2 = table
+
+        # ψ1·(|c1|²ψ1) + ψ2·(|c2|²ψ2 + 2·Re(c1·c2*)·ψ1)
+        density = psi1 * (abs(c1) ** 2)
+        density *= psi1
+        cross = psi2 * (abs(c2) ** 2)
+        cross += (2 * (c1 * c2.conjugate()).real) * psi1
+        cross *= psi2
+        density += cross
+        return density
+
+    weights = np.asarray(weights)
+    real_dtype = np.result_type(table.dtype, np.float32)
+    # Square the products in place, so Re(ψ)² + Im(ψ)² adds no temporaries
+    density = weights.real.astype(real_dtype) @ table
+    np.square(density, out=density)
+    if weights.imag.any():
+        psi_im = weights.imag.astype(real_dtype) @ table
+        density += np.square(psi_im, out=psi_im)
+
+    return density
+
+def orbital_coeffs_to_density(coeffs, x=None, y=None, z=None, spherical=None, dtype=None,
+                              workspace=None):
     """
     Calculate probability density from orbital coefficient mixture.
 
@@ -140,21 +240,24 @@ def orbital_coeffs_to_density(coeffs, x, y, z):
     Args:
         coeffs: Dict mapping (n,l,m) tuples to complex coefficients
         x, y, z: Spatial coordinates (in Bohr radii, can be arrays)
+        spherical: Optional precomputed (r, theta, phi) for x, y, z
+        dtype: Optional storage dtype of the result (e.g. np.float32)
+        workspace: Optional (table, shape) from orbital_workspace for the
+            same orbitals (in coefficient order); x, y, z are then unused
 
     Returns:
         np.array: Probability density at given points
     """
-    from .hydrogen_wavefunctions import hydrogen_orbital
+    if workspace is None:
+        workspace = orbital_workspace(coeffs, x, y, z, spherical)
+    table, shape = workspace
 
-    # Sum all orbital contributions
-    psi_total = 0.0
+    # Probability density |Σ c_i ψ_i|²
+    weights = np.array(list(coeffs.values()), dtype=complex)
+    density = mix_orbital_density(weights, table).reshape(shape)
 
-    for (n, l, m), coeff in coeffs.items():
-        psi_i = hydrogen_orbital(n, l, m, x, y, z, real_form=True)
-        psi_total += coeff * psi_i
-
-    # Probability density
-    density = np.abs(psi_total) ** 2
+    if dtype is not None:
+        density = np.asarray(density).astype(dtype, copy=False)
 
     return density
 
@@ -162,6 +265,24 @@ def orbital_coeffs_to_density(coeffs, x, y, z):
 # Pure State Mappings
 # ============================================================================
 
+# Named pure states by index: interned names, (6, 2) Bloch angles and
+# (6, 3) orbital quantum numbers, in BLOCH_PURE_STATES order
+_PURE_STATE_NAMES = tuple(sys.intern(name) for name in BLOCH_PURE_STATES)
+_PURE_STATE_INDEX = {name: i for i, name in enumerate(_PURE_STATE_NAMES)}
+_PURE_STATE_ANGLES = np.array([[info['theta'], info['phi']]
+                               for info in BLOCH_PURE_STATES.values()])
+_PURE_STATE_ORBITALS = np.array([info['orbital'] for info in BLOCH_PURE_STATES.values()],
+                                dtype=np.int8)
+_PURE_STATE_ANGLES.flags.writeable = False
+_PURE_STATE_ORBITALS.flags.writeable = False
+
+def _pure_state_index(state_name):
+    """Index of a named pure state, raising ValueError for unknown names."""
+    index = _PURE_STATE_INDEX.get(state_name)
+    if index is None:
+        raise ValueError(f"Unknown state: {state_name}")
+    return index
+
 def get_pure_state_orbital(state_name):
     """
     Get orbital quantum numbers for a named pure state.
@@ -172,10 +293,7 @@ def get_pure_state_orbital(state_name):
     Returns:
         tuple: (n, l, m) quantum numbers for corresponding orbital
     """
-    if state_name not in BLOCH_PURE_STATES:
-        raise ValueError(f"Unknown state: {state_name}")
-
-    return BLOCH_PURE_STATES[state_name]['orbital']
+    return tuple(_PURE_STATE_ORBITALS[_pure_state_index(state_name)].tolist())
 
 def get_pure_state_bloch(state_name):
     """
@@ -187,18 +305,62 @@ def get_pure_state_bloch(state_name):
     Returns:
         tuple: (theta, phi) Bloch sphere angles
     """
-    if state_name not in BLOCH_PURE_STATES:
-        raise ValueError(f"Unknown state: {state_name}")
+    theta, phi = _PURE_STATE_ANGLES[_pure_state_index(state_name)].tolist()
+    return theta, phi
 
-    return (
-        BLOCH_PURE_STATES[state_name]['theta'],
-        BLOCH_PURE_STATES[state_name]['phi']
-    )
+def get_pure_state_by_id(state_id):
+    """
+    Get Bloch sphere coordinates of pure states by index.
+
+    Indices follow BLOCH_PURE_STATES order ('|0⟩', '|1⟩', '|+⟩', '|-⟩',
+    '|+i⟩', '|-i⟩'); an array of indices selects several states at once.
+
+    Args:
+        state_id: Index, or array of indices, of pure states
+
+    Returns:
+        np.array: Read-only (theta, phi) row, or (K, 2) rows for K indices
+    """
+    return _PURE_STATE_ANGLES[state_id]
 
 # ============================================================================
 # Quantum Gate Operations
 # ============================================================================
 
+@functools.lru_cache(maxsize=256)
+def _named_gate_matrix(gate):
+    """
+    Parse a gate name into its (read-only) 2x2 matrix.
+
+    Cached, so gate sequences replayed every frame only pay the string
+    parsing and rotation matrix construction once per distinct gate.
+
+    Args:
+        gate: Gate name ('X', 'H', ...) or rotation 'RX(angle)', 'RY(angle)',
+            'RZ(angle)'
+
+    Returns:
+        np.array: 2x2 complex gate matrix
+    """
+    if gate.startswith('RX('):
+        # Rotation gate with parameter
+        angle = float(gate[3:-1])
+        gate_matrix = rotation_x(angle)
+    elif gate.startswith('RY('):
+        angle = float(gate[3:-1])
+        gate_matrix = rotation_y(angle)
+    elif gate.startswith('RZ('):
+        angle = float(gate[3:-1])
+        gate_matrix = rotation_z(angle)
+    else:
+        index = GATE_INDEX.get(gate)
+        if index is None:
+            raise ValueError(f"Unknown gate: {gate}")
+        gate_matrix = GATE_TABLE[index]
+
+    gate_matrix.flags.writeable = False
+    return gate_matrix
+
 def apply_gate_to_state(state_vector, gate):
     """
     Apply quantum gate to state vector.
@@ -211,20 +373,7 @@ def apply_gate_to_state(state_vector, gate):
         np.array: Transformed state vector
     """
     if isinstance(gate, str):
-        if gate.startswith('RX('):
-            # Rotation gate with parameter
-            angle = float(gate[3:-1])
-            gate_matrix = rotation_x(angle)
-        elif gate.startswith('RY('):
-            angle = float(gate[3:-1])
-            gate_matrix = rotation_y(angle)
-        elif gate.startswith('RZ('):
-            angle = float(gate[3:-1])
-            gate_matrix = rotation_z(angle)
-        else:
-            gate_matrix = QUANTUM_GATES.get(gate)
-            if gate_matrix is None:
-                raise ValueError(f"Unknown gate: {gate}")
+        gate_matrix = _named_gate_matrix(gate)
     else:
         gate_matrix = gate
 
@@ -233,6 +382,62 @@ def apply_gate_to_state(state_vector, gate):
 
     return new_state
 
+def compose_gates(gates):
+    """
+    Fuse a gate sequence into a single 2x2 matrix.
+
+    Args:
+        gates: Sequence of gate names and/or 2x2 matrices, in the order
+            they are applied
+
+    Returns:
+        np.array: U_total = U_K · ... · U_1
+    """
+    gates = tuple(gates)
+    if all(isinstance(gate, str) for gate in gates):
+        return _compose_named_gates(gates)
+
+    return _compose_matrices(
+        _named_gate_matrix(gate) if isinstance(gate, str) else gate
+        for gate in gates
+    )
+
+def _compose_matrices(matrices):
+    """Left-multiply matrices in application order, starting from I."""
+    return functools.reduce(lambda total, gate: gate @ total, matrices, IDENTITY.copy())
+
+@functools.lru_cache(maxsize=256)
+def _compose_named_gates(gates):
+    """Cached fused matrix for a sequence of gate names (static circuits)."""
+    total = _compose_matrices(_named_gate_matrix(gate) for gate in gates)
+    total.flags.writeable = False
+    return total
+
+def apply_circuit_to_state(state_vector, gates):
+    """
+    Apply a gate sequence to a state vector with one matrix product.
+
+    Args:
+        state_vector: Complex array [α, β], or a (2, N) batch of states
+        gates: Sequence of gate names and/or 2x2 matrices, in the order
+            they are applied
+
+    Returns:
+        np.array: Transformed state vector(s)
+    """
+    return compose_gates(gates) @ state_vector
+
+# Closed-form (theta, phi) updates for fixed gates (phi taken mod 2π by the
+# caller): phase gates rotate about z, X and Y flip the poles
+_BLOCH_GATE_MAPS = {
+    'I': lambda theta, phi: (theta, phi),
+    'X': lambda theta, phi: (np.pi - theta, -phi),
+    'Y': lambda theta, phi: (np.pi - theta, np.pi - phi),
+    'Z': lambda theta, phi: (theta, phi + np.pi),
+    'S': lambda theta, phi: (theta, phi + np.pi / 2),
+    'T': lambda theta, phi: (theta, phi + np.pi / 4),
+}
+
 def apply_gate_to_bloch(theta, phi, gate):
     """
     Apply quantum gate to state specified by Bloch angles.
@@ -244,6 +449,17 @@ def apply_gate_to_bloch(theta, phi, gate):
     Returns:
         tuple: (theta', phi') new Bloch angles after gate
     """
+    # Gates that map Bloch angles in closed form skip the state vector round
+    # trip; phi is undefined at |0⟩, so that pole takes the general path
+    if isinstance(gate, str) and theta % (2 * np.pi) != 0:
+        if gate.startswith('RZ('):
+            return theta, (phi + float(gate[3:-1])) % (2 * np.pi)
+
+        bloch_map = _BLOCH_GATE_MAPS.get(gate)
+        if bloch_map is not None:
+            new_theta, new_phi = bloch_map(theta, phi)
+            return new_theta, new_phi % (2 * np.pi)
+
     # Convert to state vector
     state = bloch_to_state_vector(theta, phi)
 
@@ -255,6 +471,48 @@ def apply_gate_to_bloch(theta, phi, gate):
 
     return new_theta, new_phi
 
+def _two_level_state(coeffs, keys):
+    """State vector [α, β] read from the |0⟩, |1⟩ orbital coefficients."""
+    return np.array([coeffs.get(keys[0], 0), coeffs.get(keys[1], 0)])
+
+def _two_level_coeffs(state, keys):
+    """Orbital coefficients holding the state vector directly."""
+    alpha, beta = state
+    return {keys[0]: alpha, keys[1]: beta}
+
+def _pp_state(coeffs):
+    """State vector [α, β] read from real p orbital coefficients."""
+    # 2pz carries cos(θ/2) and (2px, 2py) carry e^(iφ)·sin(θ/2), so the
+    # state vector is read off directly instead of through theta, phi
+    alpha = complex(np.real(coeffs.get((2, 1, 0), 0)))
+    beta = complex(np.real(coeffs.get((2, 1, 1), 0)), np.real(coeffs.get((2, 1, -1), 0)))
+
+    norm = np.sqrt(abs(alpha) ** 2 + abs(beta) ** 2)
+    return np.array([alpha, beta]) / norm
+
+def _pp_coeffs_from_state(state):
+    """Real p orbital coefficients for a state vector."""
+    alpha, beta = state
+    norm = np.sqrt(abs(alpha) ** 2 + abs(beta) ** 2)
+
+    # Remove the global phase so that α is real and non-negative
+    abs_alpha = abs(alpha)
+    if abs_alpha > 0:
+        beta = beta * (np.conj(alpha) / abs_alpha)
+    beta = beta / norm
+
+    c_px, c_py, c_pz = beta.real, beta.imag, abs_alpha / norm
+    return dict(zip(_BASIS_KEYS['pp'], (c_px, c_py, c_pz)))
+
+# Per-basis (coefficients → state vector, state vector → coefficients)
+_BASIS_GATE_IO = {
+    'sp': (functools.partial(_two_level_state, keys=_BASIS_KEYS['sp']),
+           functools.partial(_two_level_coeffs, keys=_BASIS_KEYS['sp'])),
+    'pp': (_pp_state, _pp_coeffs_from_state),
+    'sd': (functools.partial(_two_level_state, keys=_BASIS_KEYS['sd']),
+           functools.partial(_two_level_coeffs, keys=_BASIS_KEYS['sd'])),
+}
+
 def apply_gate_to_orbitals(coeffs, gate, basis='sp'):
     """
     Apply quantum gate to orbital coefficients.
@@ -267,46 +525,19 @@ def apply_gate_to_orbitals(coeffs, gate, basis='sp'):
     Returns:
         dict: New orbital coefficients after gate
     """
-    # Extract state vector from coefficients
-    if basis == 'sp':
-        alpha = coeffs.get((1, 0, 0), 0)
-        beta = coeffs.get((2, 0, 0), 0)
-    elif basis == 'pp':
-        # For p orbitals, reconstruct theta, phi
-        c_px = np.real(coeffs.get((2, 1, 1), 0))
-        c_py = np.real(coeffs.get((2, 1, -1), 0))
-        c_pz = np.real(coeffs.get((2, 1, 0), 0))
-
-        theta = 2 * np.arccos(c_pz)
-        phi = np.arctan2(c_py, c_px)
-
-        alpha = np.cos(theta / 2)
-        beta = np.exp(1j * phi) * np.sin(theta / 2)
-    else:
-        alpha = coeffs.get((1, 0, 0), 0)
-        beta = coeffs.get((3, 2, 0), 0)
+    entry = _BASIS_GATE_IO.get(basis)
+    if entry is None:
+        raise ValueError(f"Unknown basis: {basis}. Use 'sp', 'pp', or 'sd'")
+    to_state, from_state = entry
 
-    state = np.array([alpha, beta])
+    # Extract state vector from coefficients
+    state = to_state(coeffs)
 
     # Apply gate
     new_state = apply_gate_to_state(state, gate)
 
     # Convert back to orbital coefficients
-    if basis == 'pp':
-        new_theta, new_phi = state_vector_to_bloch(new_state)
-        return bloch_to_orbital_coeffs(new_theta, new_phi, basis='pp')
-    else:
-        alpha_new, beta_new = new_state
-        if basis == 'sp':
-            return {
-                (1, 0, 0): alpha_new,
-                (2, 0, 0): beta_new,
-            }
-        else:  # sd
-            return {
-                (1, 0, 0): alpha_new,
-                (3, 2, 0): beta_new,
-            }
+    return from_state(new_state)
 
 # ============================================================================
 # Superposition Analysis
@@ -323,36 +554,31 @@ def analyze_superposition(theta, phi, basis='sp'):
     Returns:
         dict: Analysis results including coefficients, probabilities, phases
     """
-    coeffs = bloch_to_orbital_coeffs(theta, phi, basis)
+    _, coeffs = bloch_to_orbital_arrays(theta, phi, basis)
+    keys = _BASIS_KEYS[basis]
+
+    # Calculate probabilities and phases for all orbitals at once
+    probs = coeffs.real ** 2 + coeffs.imag ** 2
+    phases = np.angle(coeffs)
 
     analysis = {
         'theta': theta,
         'phi': phi,
         'basis': basis,
-        'coefficients': coeffs,
-        'probabilities': {},
-        'phases': {},
+        'coefficients': dict(zip(keys, coeffs)),
+        'probabilities': dict(zip(keys, probs.tolist())),
+        'phases': dict(zip(keys, phases.tolist())),
         'coherence': None,
     }
 
-    # Calculate probabilities and phases
-    total_prob = 0
-    for nlm, coeff in coeffs.items():
-        prob = np.abs(coeff) ** 2
-        phase = np.angle(coeff)
-
-        analysis['probabilities'][nlm] = prob
-        analysis['phases'][nlm] = phase
-        total_prob += prob
-
     # Coherence (off-diagonal density matrix element)
     if len(coeffs) == 2:
-        keys = list(coeffs.keys())
-        c1, c2 = coeffs[keys[0]], coeffs[keys[1]]
-        analysis['coherence'] = c1 * np.conj(c2)
+        analysis['coherence'] = coeffs[0] * np.conj(coeffs[1])
 
     # Normalization check
-    analysis['normalized'] = np.isclose(total_prob, 1.0)
+    # Same tolerance as np.isclose(total, 1.0), without the ufunc call
+    total_prob = float(probs.sum())
+    analysis['normalized'] = abs(total_prob - 1.0) <= 1e-8 + 1e-5
 
     return analysis
 
@@ -370,24 +596,30 @@ def get_interference_pattern(theta, phi, axis='z', extent=20, resolution=100, ba
     Returns:
         tuple: (positions, densities) for plotting
     """
-    coeffs = bloch_to_orbital_coeffs(theta, phi, basis)
+    if axis not in ('x', 'y', 'z'):
+        raise ValueError(f"Unknown axis: {axis}")
 
-    # Create line along axis
-    positions = np.linspace(-extent, extent, resolution)
+    coeffs = bloch_to_orbital_coeffs(theta, phi, basis)
 
-    if axis == 'x':
-        x, y, z = positions, 0, 0
-    elif axis == 'y':
-        x, y, z = 0, positions, 0
-    elif axis == 'z':
-        x, y, z = 0, 0, positions
-    else:
-        raise ValueError(f"Unknown axis: {axis}")
+    # The orbitals on the line are shared by every (theta, phi)
+    positions, workspace = _line_workspace(tuple(coeffs), axis, extent, resolution)
 
     # Calculate density
-    density = orbital_coeffs_to_density(coeffs, x, y, z)
+    density = orbital_coeffs_to_density(coeffs, workspace=workspace)
 
-    return positions, density
+    return positions.copy(), density
+
+@functools.lru_cache(maxsize=64)
+def _line_workspace(orbitals, axis, extent, resolution):
+    """Cached (positions, orbital workspace) along a coordinate axis."""
+    positions = np.linspace(-extent, extent, resolution)
+
+    x, y, z = (positions if axis == a else 0 for a in 'xyz')
+    workspace = orbital_workspace(orbitals, x, y, z)
+
+    positions.flags.writeable = False
+    workspace[0].flags.writeable = False
+    return positions, workspace
 
 # ============================================================================
 # Special Superposition States
@@ -431,13 +663,24 @@ def create_arbitrary_superposition(amplitudes, basis='sp'):
     Returns:
         dict: Orbital coefficients
     """
-    # Normalize
-    alpha, beta = amplitudes
-    norm = np.sqrt(np.abs(alpha) ** 2 + np.abs(beta) ** 2)
-    alpha /= norm
-    beta /= norm
+    entry = _BASIS_GATE_IO.get(basis)
+    if entry is None:
+        raise ValueError(f"Unknown basis: {basis}. Use 'sp', 'pp', or 'sd'")
+    _, from_state = entry
+
+    state = np.array(amplitudes, dtype=complex)
+
+    # Normalize (skipped for amplitudes that already are)
+    norm_sq = abs(state[0]) ** 2 + abs(state[1]) ** 2
+    if abs(norm_sq - 1.0) > 1e-12:
+        state /= np.sqrt(norm_sq)
 
-    # Convert to Bloch then to orbitals
-    theta, phi = state_vector_to_bloch([alpha, beta])
+    # Drop the global phase so that α is real and non-negative, as the
+    # Bloch sphere parameterization has it; the orbital coefficients then
+    # follow without a round trip through (theta, phi)
+    abs_alpha = abs(state[0])
+    if abs_alpha > 0:
+        state *= np.conj(state[0]) / abs_alpha
+        state[0] = abs_alpha
 
-    return bloch_to_orbital_coeffs(theta, phi, basis)
+    return from_state(state)
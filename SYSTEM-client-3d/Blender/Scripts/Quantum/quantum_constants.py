@@ -5,6 +5,7 @@ Physical constants, quantum number ranges, and visualization parameters
 for hydrogen orbital calculations.
 """
 
+import math
 import numpy as np
 
 # ============================================================================
@@ -164,40 +165,62 @@ PHASE_NEGATIVE_COLOR = (0.3, 0.3, 1.0, 0.7)  # Blue for negative phase
 # Quantum Gates
 # ============================================================================
 
+# Fixed gates, stored contiguously as one complex128 (G, 2, 2) table;
+# the named matrices below are views into it
+GATE_NAMES = ('I', 'X', 'Y', 'Z', 'H', 'S', 'T')
+GATE_INDEX = {name: i for i, name in enumerate(GATE_NAMES)}
+GATE_TABLE = np.array([
+    [[1, 0], [0, 1]],                        # I
+    [[0, 1], [1, 0]],                        # X
+    [[0, -1j], [1j, 0]],                     # Y
+    [[1, 0], [0, -1]],                       # Z
+    np.array([[1, 1], [1, -1]]) / np.sqrt(2),  # H
+    [[1, 0], [0, 1j]],                       # S
+    [[1, 0], [0, np.exp(1j * np.pi / 4)]],   # T
+], dtype=complex)
+
 # Pauli matrices (for gate operations)
-PAULI_X = np.array([[0, 1], [1, 0]], dtype=complex)
-PAULI_Y = np.array([[0, -1j], [1j, 0]], dtype=complex)
-PAULI_Z = np.array([[1, 0], [0, -1]], dtype=complex)
-IDENTITY = np.array([[1, 0], [0, 1]], dtype=complex)
+IDENTITY = GATE_TABLE[GATE_INDEX['I']]
+PAULI_X = GATE_TABLE[GATE_INDEX['X']]
+PAULI_Y = GATE_TABLE[GATE_INDEX['Y']]
+PAULI_Z = GATE_TABLE[GATE_INDEX['Z']]
+
+# Pauli matrices stacked (3, 2, 2) for batched ⟨X⟩, ⟨Y⟩, ⟨Z⟩ expectations
+PAULIS_XYZ = GATE_TABLE[GATE_INDEX['X']:GATE_INDEX['Z'] + 1]
 
 # Hadamard gate
-HADAMARD = np.array([[1, 1], [1, -1]], dtype=complex) / np.sqrt(2)
+HADAMARD = GATE_TABLE[GATE_INDEX['H']]
 
 # Phase gates
-S_GATE = np.array([[1, 0], [0, 1j]], dtype=complex)
-T_GATE = np.array([[1, 0], [0, np.exp(1j * np.pi / 4)]], dtype=complex)
+S_GATE = GATE_TABLE[GATE_INDEX['S']]
+T_GATE = GATE_TABLE[GATE_INDEX['T']]
 
-# Rotation gates (parameterized)
+# Rotation gates (parameterized); filled in place from scalar half-angle
+# terms rather than parsed from nested lists
 def rotation_x(theta):
     """Rotation around X-axis by angle theta."""
-    return np.array([
-        [np.cos(theta/2), -1j * np.sin(theta/2)],
-        [-1j * np.sin(theta/2), np.cos(theta/2)]
-    ], dtype=complex)
+    c, s = math.cos(theta / 2), math.sin(theta / 2)
+    gate = np.empty((2, 2), dtype=complex)
+    gate[0, 0] = gate[1, 1] = c
+    gate[0, 1] = gate[1, 0] = -1j * s
+    return gate
 
 def rotation_y(theta):
     """Rotation around Y-axis by angle theta."""
-    return np.array([
-        [np.cos(theta/2), -np.sin(theta/2)],
-        [np.sin(theta/2), np.cos(theta/2)]
-    ], dtype=complex)
+    c, s = math.cos(theta / 2), math.sin(theta / 2)
+    gate = np.empty((2, 2), dtype=complex)
+    gate[0, 0] = gate[1, 1] = c
+    gate[0, 1] = -s
+    gate[1, 0] = s
+    return gate
 
 def rotation_z(theta):
     """Rotation around Z-axis by angle theta."""
-    return np.array([
-        [np.exp(-1j * theta/2), 0],
-        [0, np.exp(1j * theta/2)]
-    ], dtype=complex)
+    c, s = math.cos(theta / 2), math.sin(theta / 2)
+    gate = np.zeros((2, 2), dtype=complex)
+    gate[0, 0] = complex(c, -s)
+    gate[1, 1] = complex(c, s)
+    return gate
 
 # Gate name mapping
 QUANTUM_GATES = {
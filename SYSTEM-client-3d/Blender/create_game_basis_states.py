@@ -17,6 +17,24 @@ import sys
 from pathlib import Path
 import numpy as np
 
+# ============================================================================
+# Shell Colors
+# ============================================================================
+
+# GREEN color scheme (like your game's north pole marker)
+COLORS_GROUND = (
+    (0.2, 1.0, 0.3, 0.4),   # Light green (outer)
+    (0.1, 0.9, 0.2, 0.6),   # Medium green (middle)
+    (0.0, 0.7, 0.1, 0.8),   # Deep green (inner, more opaque)
+)
+
+# RED color scheme (like your game's south pole / red crystal)
+COLORS_EXCITED = (
+    (1.0, 0.3, 0.2, 0.3),   # Light red (outer shell)
+    (0.9, 0.2, 0.1, 0.5),   # Medium red (middle)
+    (0.8, 0.1, 0.0, 0.7),   # Deep red (inner, near node)
+)
+
 # ============================================================================
 # Setup Path
 # ============================================================================
@@ -41,11 +59,13 @@ def setup_path():
         except:
             pass
 
-    # Method 3: Hardcoded
+    # Method 3: Hardcoded for known installation
     if script_dir is None or not script_dir.exists():
         script_dir = Path(r"H:\SpaceTime\SYSTEM\SYSTEM-client-3d\Blender\Scripts")
+        if not script_dir.exists():
+            return script_dir
 
-    if script_dir.exists() and str(script_dir) not in sys.path:
+    if str(script_dir) not in sys.path:
         sys.path.insert(0, str(script_dir))
         print(f"Added to path: {script_dir}")
 
@@ -64,9 +84,11 @@ def create_game_basis_states():
     print("=" * 70)
 
     # Import after path setup
-    from Generators.hydrogen_orbital_meshes import clear_orbital_objects, create_blender_mesh
-    from Quantum.hydrogen_wavefunctions import calculate_density_grid
-    from skimage import measure
+    from Generators.hydrogen_orbital_meshes import (
+        ISO_EXCITED, ISO_GROUND, SHELL_STEPS, build_shells, clear_orbital_objects,
+        create_emissive_material, precompute_grid_params, select_objects,
+    )
+    from Quantum.hydrogen_wavefunctions import cached_density_grid
 
     # Clear existing orbitals
     clear_orbital_objects()
@@ -86,63 +108,23 @@ def create_game_basis_states():
 
     # Calculate 1s orbital density
     print("\n  Calculating 1s wave function...")
-    x_grid_0, y_grid_0, z_grid_0, density_0 = calculate_density_grid(
+    x_grid_0, y_grid_0, z_grid_0, density_0 = cached_density_grid(
         n=1, l=0, m=0,
         extent=15,      # Compact extent
         resolution=80   # Good detail
     )
 
-    # Normalize density
     max_density_0 = np.max(density_0)
-    density_0_norm = density_0 / max_density_0
 
-    print(f"  Max density: {max_density_0:.6f}")
-
-    # GREEN color scheme (like your game's north pole marker)
-    # Multiple shells for depth and better visualization
-    iso_levels_0 = [0.05, 0.15, 0.30]
-    colors_0 = [
-        (0.2, 1.0, 0.3, 0.4),   # Light green (outer)
-        (0.1, 0.9, 0.2, 0.6),   # Medium green (middle)
-        (0.0, 0.7, 0.1, 0.8),   # Deep green (inner, more opaque)
-    ]
+    spacing_0, origin_0 = precompute_grid_params(x_grid_0, y_grid_0, z_grid_0)
 
-    objects_0 = []
-    for i, (iso_val, color) in enumerate(zip(iso_levels_0, colors_0)):
-        print(f"  Creating isosurface {i+1}/{len(iso_levels_0)} at {iso_val*100:.0f}%...")
+    print(f"  Max density: {max_density_0:.6f}")
 
-        try:
-            verts, faces, normals, values = measure.marching_cubes(
-                density_0_norm,
-                level=iso_val,
-                spacing=(
-                    x_grid_0[1, 0, 0] - x_grid_0[0, 0, 0],
-                    y_grid_0[0, 1, 0] - y_grid_0[0, 0, 0],
-                    z_grid_0[0, 0, 1] - z_grid_0[0, 0, 0],
-                )
-            )
-
-            # Offset vertices
-            verts[:, 0] += x_grid_0[0, 0, 0]
-            verts[:, 1] += y_grid_0[0, 0, 0]
-            verts[:, 2] += z_grid_0[0, 0, 0]
-
-            # Create mesh in Blender
-            obj = create_blender_mesh(
-                name=f"ket0_green_shell{i}",
-                vertices=verts,
-                faces=faces,
-                color=color
-            )
-
-            # Position: ABOVE (North pole, +Y direction)
-            obj.location.y = +30  # 30 units UP (+Y)
-
-            objects_0.append(obj)
-            print(f"    Created with {len(verts)} vertices")
-
-        except ValueError as e:
-            print(f"    Skipped (no surface at this level)")
+    # Position: ABOVE (North pole, +Y direction)
+    objects_0 = build_shells(
+        density_0, spacing_0, origin_0, ISO_GROUND, COLORS_GROUND,
+        "ket0_green_shell{}", location=(0, +30, 0), peak=max_density_0, step_sizes=SHELL_STEPS,
+    )
 
     print(f"\n  ✓ Created |0⟩ state with {len(objects_0)} shells")
     print(f"    Color: GREEN")
@@ -164,63 +146,23 @@ def create_game_basis_states():
 
     # Calculate 2s orbital density
     print("\n  Calculating 2s wave function...")
-    x_grid_1, y_grid_1, z_grid_1, density_1 = calculate_density_grid(
+    x_grid_1, y_grid_1, z_grid_1, density_1 = cached_density_grid(
         n=2, l=0, m=0,
         extent=40,      # Larger extent (excited state)
         resolution=80   # Good detail
     )
 
-    # Normalize density
     max_density_1 = np.max(density_1)
-    density_1_norm = density_1 / max_density_1
 
-    print(f"  Max density: {max_density_1:.6f}")
-
-    # RED color scheme (like your game's south pole / red crystal)
-    # Lower iso values to show the outer shell and node structure
-    iso_levels_1 = [0.02, 0.05, 0.15]
-    colors_1 = [
-        (1.0, 0.3, 0.2, 0.3),   # Light red (outer shell)
-        (0.9, 0.2, 0.1, 0.5),   # Medium red (middle)
-        (0.8, 0.1, 0.0, 0.7),   # Deep red (inner, near node)
-    ]
+    spacing_1, origin_1 = precompute_grid_params(x_grid_1, y_grid_1, z_grid_1)
 
-    objects_1 = []
-    for i, (iso_val, color) in enumerate(zip(iso_levels_1, colors_1)):
-        print(f"  Creating isosurface {i+1}/{len(iso_levels_1)} at {iso_val*100:.1f}%...")
+    print(f"  Max density: {max_density_1:.6f}")
 
-        try:
-            verts, faces, normals, values = measure.marching_cubes(
-                density_1_norm,
-                level=iso_val,
-                spacing=(
-                    x_grid_1[1, 0, 0] - x_grid_1[0, 0, 0],
-                    y_grid_1[0, 1, 0] - y_grid_1[0, 0, 0],
-                    z_grid_1[0, 0, 1] - z_grid_1[0, 0, 0],
-                )
-            )
-
-            # Offset vertices
-            verts[:, 0] += x_grid_1[0, 0, 0]
-            verts[:, 1] += y_grid_1[0, 0, 0]
-            verts[:, 2] += z_grid_1[0, 0, 0]
-
-            # Create mesh in Blender
-            obj = create_blender_mesh(
-                name=f"ket1_red_shell{i}",
-                vertices=verts,
-                faces=faces,
-                color=color
-            )
-
-            # Position: BELOW (South pole, -Y direction)
-            obj.location.y = -30  # 30 units DOWN (-Y)
-
-            objects_1.append(obj)
-            print(f"    Created with {len(verts)} vertices")
-
-        except ValueError as e:
-            print(f"    Skipped (no surface at this level)")
+    # Position: BELOW (South pole, -Y direction)
+    objects_1 = build_shells(
+        density_1, spacing_1, origin_1, ISO_EXCITED, COLORS_EXCITED,
+        "ket1_red_shell{}", location=(0, -30, 0), peak=max_density_1, step_sizes=SHELL_STEPS,
+    )
 
     print(f"\n  ✓ Created |1⟩ state with {len(objects_1)} shells")
     print(f"    Color: RED")
@@ -237,42 +179,34 @@ def create_game_basis_states():
     print("-" * 70)
 
     # Add |0⟩ label (GREEN, NORTH)
-    bpy.ops.object.text_add(location=(0, 25, -15))
-    text_0 = bpy.context.active_object
-    text_0.name = "Label_ket0_north"
-    text_0.data.body = "|0⟩\nNorth Pole (+Y)\n1s orbital\nGREEN"
-    text_0.data.align_x = 'CENTER'
-    text_0.data.size = 3
+    text_0_data = bpy.data.curves.new(name="Label_ket0_north", type='FONT')
+    text_0_data.body = "|0⟩\nNorth Pole (+Y)\n1s orbital\nGREEN"
+    text_0_data.align_x = 'CENTER'
+    text_0_data.size = 3
+    text_0 = bpy.data.objects.new("Label_ket0_north", text_0_data)
+    text_0.location = (0, 25, -15)
+    bpy.context.collection.objects.link(text_0)
 
     # Green material for text
-    mat_0 = bpy.data.materials.new(name="Label0_material")
-    mat_0.use_nodes = True
-    bsdf_0 = mat_0.node_tree.nodes.get("Principled BSDF")
-    if bsdf_0:
-        bsdf_0.inputs['Base Color'].default_value = (0.2, 1.0, 0.3, 1.0)
-        bsdf_0.inputs['Emission'].default_value = (0.2, 1.0, 0.3, 1.0)
-        bsdf_0.inputs['Emission Strength'].default_value = 2.0
-    text_0.data.materials.append(mat_0)
+    text_0.data.materials.append(
+        create_emissive_material("Label0_material", (0.2, 1.0, 0.3, 1.0), emission_strength=2.0)
+    )
 
     print("  ✓ Added |0⟩ label (green, north)")
 
     # Add |1⟩ label (RED, SOUTH)
-    bpy.ops.object.text_add(location=(0, -25, -15))
-    text_1 = bpy.context.active_object
-    text_1.name = "Label_ket1_south"
-    text_1.data.body = "|1⟩\nSouth Pole (-Y)\n2s orbital\nRED"
-    text_1.data.align_x = 'CENTER'
-    text_1.data.size = 3
+    text_1_data = bpy.data.curves.new(name="Label_ket1_south", type='FONT')
+    text_1_data.body = "|1⟩\nSouth Pole (-Y)\n2s orbital\nRED"
+    text_1_data.align_x = 'CENTER'
+    text_1_data.size = 3
+    text_1 = bpy.data.objects.new("Label_ket1_south", text_1_data)
+    text_1.location = (0, -25, -15)
+    bpy.context.collection.objects.link(text_1)
 
     # Red material for text
-    mat_1 = bpy.data.materials.new(name="Label1_material")
-    mat_1.use_nodes = True
-    bsdf_1 = mat_1.node_tree.nodes.get("Principled BSDF")
-    if bsdf_1:
-        bsdf_1.inputs['Base Color'].default_value = (1.0, 0.3, 0.2, 1.0)
-        bsdf_1.inputs['Emission'].default_value = (1.0, 0.3, 0.2, 1.0)
-        bsdf_1.inputs['Emission Strength'].default_value = 2.0
-    text_1.data.materials.append(mat_1)
+    text_1.data.materials.append(
+        create_emissive_material("Label1_material", (1.0, 0.3, 0.2, 1.0), emission_strength=2.0)
+    )
 
     print("  ✓ Added |1⟩ label (red, south)")
 
@@ -292,22 +226,21 @@ def create_game_basis_states():
     # Create a polyline
     polyline = curve_data.splines.new('POLY')
     polyline.points.add(1)  # We need 2 points total (one already exists)
-    polyline.points[0].co = (0, -40, 0, 1)  # Bottom
-    polyline.points[1].co = (0, +40, 0, 1)  # Top
+
+    # Bottom and top written in one bulk call: (x, y, z, w) per point
+    polyline.points.foreach_set("co", (
+        0, -40, 0, 1,  # Bottom
+        0, +40, 0, 1,  # Top
+    ))
 
     # Create object
     curve_obj = bpy.data.objects.new('Y_Axis_Line', curve_data)
     bpy.context.collection.objects.link(curve_obj)
 
     # Material for axis line
-    mat_axis = bpy.data.materials.new(name="Axis_material")
-    mat_axis.use_nodes = True
-    bsdf_axis = mat_axis.node_tree.nodes.get("Principled BSDF")
-    if bsdf_axis:
-        bsdf_axis.inputs['Base Color'].default_value = (0.5, 0.5, 0.5, 1.0)
-        bsdf_axis.inputs['Emission'].default_value = (0.5, 0.5, 0.5, 1.0)
-        bsdf_axis.inputs['Emission Strength'].default_value = 1.0
-    curve_data.materials.append(mat_axis)
+    curve_data.materials.append(
+        create_emissive_material("Axis_material", (0.5, 0.5, 0.5, 1.0), emission_strength=1.0)
+    )
 
     # Set bevel for visible line
     curve_data.bevel_depth = 0.2
@@ -323,12 +256,7 @@ def create_game_basis_states():
     print("-" * 70)
 
     # Select all orbital objects for framing
-    bpy.ops.object.select_all(action='DESELECT')
-    for obj in objects_0 + objects_1:
-        obj.select_set(True)
-
-    if objects_0:
-        bpy.context.view_layer.objects.active = objects_0[0]
+    select_objects(objects_0 + objects_1, active=objects_0[0] if objects_0 else None)
 
     print("  ✓ Selected all orbital objects")
 
@@ -392,7 +320,8 @@ if __name__ == "__main__":
 
     # Create the states
     try:
-        objects_0, objects_1 = create_game_basis_states()
+        from Generators.hydrogen_orbital_meshes import batched_output
+        objects_0, objects_1 = batched_output(create_game_basis_states)()
         print("Done! Check the 3D viewport.")
         print("\nThese states now match your SYSTEM game's Bloch sphere:")
         print("  - GREEN |0⟩ at north pole (+Y)")
@@ -10,6 +10,7 @@ Run this in Blender to see the quantum basis states side by side.
 
 import bpy
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import numpy as np
 
@@ -37,16 +38,53 @@ def setup_path():
         except:
             pass
 
-    # Method 3: Hardcoded
+    # Method 3: Hardcoded for known installation
     if script_dir is None or not script_dir.exists():
         script_dir = Path(r"H:\SpaceTime\SYSTEM\SYSTEM-client-3d\Blender\Scripts")
+        if not script_dir.exists():
+            return script_dir
 
-    if script_dir.exists() and str(script_dir) not in sys.path:
+    if str(script_dir) not in sys.path:
         sys.path.insert(0, str(script_dir))
         print(f"Added to path: {script_dir}")
 
     return script_dir
 
+# ============================================================================
+# Shell Colors
+# ============================================================================
+
+# |0⟩: BLUE
+COLORS_GROUND = (
+    (0.2, 0.4, 1.0, 0.4),   # Light blue (outer)
+    (0.1, 0.3, 0.9, 0.6),   # Medium blue (middle)
+    (0.0, 0.2, 0.8, 0.8),   # Deep blue (inner, more opaque)
+)
+
+# |1⟩: RED - emphasize the node structure
+COLORS_EXCITED = (
+    (1.0, 0.3, 0.3, 0.3),   # Light red (outer shell)
+    (0.9, 0.2, 0.2, 0.5),   # Medium red (middle)
+    (0.8, 0.1, 0.1, 0.7),   # Deep red (inner, near node)
+)
+
+# ============================================================================
+# Density Grids
+# ============================================================================
+
+# (n, l, m, extent) of the |0⟩ and |1⟩ orbitals
+STATE_ORBITALS = (
+    (1, 0, 0, 15),  # 1s: smaller extent (compact)
+    (2, 0, 0, 40),  # 2s: larger extent (diffuse)
+)
+
+def state_grid(n, l, m, extent):
+    """Cached density grid of an orbital at the script's resolution."""
+    from Quantum.hydrogen_wavefunctions import cached_density_grid
+
+    # Always called with the same argument form so the cache keys match
+    return cached_density_grid(n=n, l=l, m=m, extent=extent, resolution=80)
+
 # ============================================================================
 # Main Creation Function
 # ============================================================================
@@ -59,14 +97,20 @@ def create_zero_one_states():
     print("=" * 70)
 
     # Import after path setup
-    from Generators.hydrogen_orbital_meshes import clear_orbital_objects, create_blender_mesh
-    from Quantum.hydrogen_wavefunctions import calculate_density_grid
-    from skimage import measure
+    from Generators.hydrogen_orbital_meshes import (
+        ISO_EXCITED, ISO_GROUND, SHELL_STEPS, build_shells, clear_orbital_objects,
+        create_emissive_material, precompute_grid_params, select_objects,
+    )
 
     # Clear existing orbitals
     clear_orbital_objects()
     print("\nCleared existing orbital objects")
 
+    # The two grids are independent and NumPy releases the GIL, so compute
+    # them concurrently; state_grid below then reads them from the cache
+    with ThreadPoolExecutor(max_workers=len(STATE_ORBITALS)) as executor:
+        list(executor.map(lambda orbital: state_grid(*orbital), STATE_ORBITALS))
+
     # ========================================================================
     # Create |0⟩ State - 1s Orbital (BLUE, SMALL, COMPACT)
     # ========================================================================
@@ -75,64 +119,20 @@ def create_zero_one_states():
     print("Creating |0⟩ State (1s orbital)")
     print("-" * 70)
 
-    # Calculate 1s orbital density
     print("  Calculating 1s wave function...")
-    x_grid_0, y_grid_0, z_grid_0, density_0 = calculate_density_grid(
-        n=1, l=0, m=0,
-        extent=15,      # Smaller extent (compact)
-        resolution=80   # Good detail
-    )
+    x_grid_0, y_grid_0, z_grid_0, density_0 = state_grid(*STATE_ORBITALS[0])
 
-    # Normalize density
     max_density_0 = np.max(density_0)
-    density_0_norm = density_0 / max_density_0
 
-    print(f"  Max density: {max_density_0:.6f}")
-
-    # Create isosurfaces for |0⟩
-    iso_levels_0 = [0.05, 0.15, 0.30]  # Multiple shells for depth
-    colors_0 = [
-        (0.2, 0.4, 1.0, 0.4),   # Light blue (outer)
-        (0.1, 0.3, 0.9, 0.6),   # Medium blue (middle)
-        (0.0, 0.2, 0.8, 0.8),   # Deep blue (inner, more opaque)
-    ]
+    spacing_0, origin_0 = precompute_grid_params(x_grid_0, y_grid_0, z_grid_0)
 
-    objects_0 = []
-    for i, (iso_val, color) in enumerate(zip(iso_levels_0, colors_0)):
-        print(f"  Creating isosurface {i+1}/{len(iso_levels_0)} at {iso_val*100:.0f}%...")
+    print(f"  Max density: {max_density_0:.6f}")
 
-        try:
-            verts, faces, normals, values = measure.marching_cubes(
-                density_0_norm,
-                level=iso_val,
-                spacing=(
-                    x_grid_0[1, 0, 0] - x_grid_0[0, 0, 0],
-                    y_grid_0[0, 1, 0] - y_grid_0[0, 0, 0],
-                    z_grid_0[0, 0, 1] - z_grid_0[0, 0, 0],
-                )
-            )
-
-            # Offset vertices
-            verts[:, 0] += x_grid_0[0, 0, 0]
-            verts[:, 1] += y_grid_0[0, 0, 0]
-            verts[:, 2] += z_grid_0[0, 0, 0]
-
-            # Create mesh in Blender
-            obj = create_blender_mesh(
-                name=f"ket0_shell{i}",
-                vertices=verts,
-                faces=faces,
-                color=color
-            )
-
-            # Position: Left side
-            obj.location.x = -30  # 30 units to the left
-
-            objects_0.append(obj)
-            print(f"    Created with {len(verts)} vertices")
-
-        except ValueError as e:
-            print(f"    Skipped (no surface at this level)")
+    # Position: left side, 30 units to the left
+    objects_0 = build_shells(
+        density_0, spacing_0, origin_0, ISO_GROUND, COLORS_GROUND,
+        "ket0_shell{}", location=(-30, 0, 0), peak=max_density_0, step_sizes=SHELL_STEPS,
+    )
 
     print(f"\n  ✓ Created |0⟩ state with {len(objects_0)} shells")
     print(f"    Color: BLUE")
@@ -147,64 +147,20 @@ def create_zero_one_states():
     print("Creating |1⟩ State (2s orbital)")
     print("-" * 70)
 
-    # Calculate 2s orbital density
     print("  Calculating 2s wave function...")
-    x_grid_1, y_grid_1, z_grid_1, density_1 = calculate_density_grid(
-        n=2, l=0, m=0,
-        extent=40,      # Larger extent (diffuse)
-        resolution=80   # Good detail
-    )
+    x_grid_1, y_grid_1, z_grid_1, density_1 = state_grid(*STATE_ORBITALS[1])
 
-    # Normalize density
     max_density_1 = np.max(density_1)
-    density_1_norm = density_1 / max_density_1
-
-    print(f"  Max density: {max_density_1:.6f}")
 
-    # Create isosurfaces for |1⟩ - emphasize the node structure
-    iso_levels_1 = [0.02, 0.05, 0.15]  # Lower levels to show outer shell
-    colors_1 = [
-        (1.0, 0.3, 0.3, 0.3),   # Light red (outer shell)
-        (0.9, 0.2, 0.2, 0.5),   # Medium red (middle)
-        (0.8, 0.1, 0.1, 0.7),   # Deep red (inner, near node)
-    ]
+    spacing_1, origin_1 = precompute_grid_params(x_grid_1, y_grid_1, z_grid_1)
 
-    objects_1 = []
-    for i, (iso_val, color) in enumerate(zip(iso_levels_1, colors_1)):
-        print(f"  Creating isosurface {i+1}/{len(iso_levels_1)} at {iso_val*100:.1f}%...")
+    print(f"  Max density: {max_density_1:.6f}")
 
-        try:
-            verts, faces, normals, values = measure.marching_cubes(
-                density_1_norm,
-                level=iso_val,
-                spacing=(
-                    x_grid_1[1, 0, 0] - x_grid_1[0, 0, 0],
-                    y_grid_1[0, 1, 0] - y_grid_1[0, 0, 0],
-                    z_grid_1[0, 0, 1] - z_grid_1[0, 0, 0],
-                )
-            )
-
-            # Offset vertices
-            verts[:, 0] += x_grid_1[0, 0, 0]
-            verts[:, 1] += y_grid_1[0, 0, 0]
-            verts[:, 2] += z_grid_1[0, 0, 0]
-
-            # Create mesh in Blender
-            obj = create_blender_mesh(
-                name=f"ket1_shell{i}",
-                vertices=verts,
-                faces=faces,
-                color=color
-            )
-
-            # Position: Right side
-            obj.location.x = +30  # 30 units to the right
-
-            objects_1.append(obj)
-            print(f"    Created with {len(verts)} vertices")
-
-        except ValueError as e:
-            print(f"    Skipped (no surface at this level)")
+    # Position: right side, 30 units to the right
+    objects_1 = build_shells(
+        density_1, spacing_1, origin_1, ISO_EXCITED, COLORS_EXCITED,
+        "ket1_shell{}", location=(+30, 0, 0), peak=max_density_1, step_sizes=SHELL_STEPS,
+    )
 
     print(f"\n  ✓ Created |1⟩ state with {len(objects_1)} shells")
     print(f"    Color: RED")
@@ -220,42 +176,34 @@ def create_zero_one_states():
     print("-" * 70)
 
     # Add |0⟩ label
-    bpy.ops.object.text_add(location=(-30, -25, 0))
-    text_0 = bpy.context.active_object
-    text_0.name = "Label_ket0"
-    text_0.data.body = "|0⟩\n1s orbital\n(ground state)"
-    text_0.data.align_x = 'CENTER'
-    text_0.data.size = 3
+    text_0_data = bpy.data.curves.new(name="Label_ket0", type='FONT')
+    text_0_data.body = "|0⟩\n1s orbital\n(ground state)"
+    text_0_data.align_x = 'CENTER'
+    text_0_data.size = 3
+    text_0 = bpy.data.objects.new("Label_ket0", text_0_data)
+    text_0.location = (-30, -25, 0)
+    bpy.context.collection.objects.link(text_0)
 
     # Blue material for text
-    mat_0 = bpy.data.materials.new(name="Label0_material")
-    mat_0.use_nodes = True
-    bsdf_0 = mat_0.node_tree.nodes.get("Principled BSDF")
-    if bsdf_0:
-        bsdf_0.inputs['Base Color'].default_value = (0.2, 0.4, 1.0, 1.0)
-        bsdf_0.inputs['Emission'].default_value = (0.2, 0.4, 1.0, 1.0)
-        bsdf_0.inputs['Emission Strength'].default_value = 2.0
-    text_0.data.materials.append(mat_0)
+    text_0.data.materials.append(
+        create_emissive_material("Label0_material", (0.2, 0.4, 1.0, 1.0), emission_strength=2.0)
+    )
 
     print("  ✓ Added |0⟩ label (blue)")
 
     # Add |1⟩ label
-    bpy.ops.object.text_add(location=(+30, -25, 0))
-    text_1 = bpy.context.active_object
-    text_1.name = "Label_ket1"
-    text_1.data.body = "|1⟩\n2s orbital\n(excited state)"
-    text_1.data.align_x = 'CENTER'
-    text_1.data.size = 3
+    text_1_data = bpy.data.curves.new(name="Label_ket1", type='FONT')
+    text_1_data.body = "|1⟩\n2s orbital\n(excited state)"
+    text_1_data.align_x = 'CENTER'
+    text_1_data.size = 3
+    text_1 = bpy.data.objects.new("Label_ket1", text_1_data)
+    text_1.location = (+30, -25, 0)
+    bpy.context.collection.objects.link(text_1)
 
     # Red material for text
-    mat_1 = bpy.data.materials.new(name="Label1_material")
-    mat_1.use_nodes = True
-    bsdf_1 = mat_1.node_tree.nodes.get("Principled BSDF")
-    if bsdf_1:
-        bsdf_1.inputs['Base Color'].default_value = (1.0, 0.3, 0.3, 1.0)
-        bsdf_1.inputs['Emission'].default_value = (1.0, 0.3, 0.3, 1.0)
-        bsdf_1.inputs['Emission Strength'].default_value = 2.0
-    text_1.data.materials.append(mat_1)
+    text_1.data.materials.append(
+        create_emissive_material("Label1_material", (1.0, 0.3, 0.3, 1.0), emission_strength=2.0)
+    )
 
     print("  ✓ Added |1⟩ label (red)")
 
@@ -268,12 +216,7 @@ def create_zero_one_states():
     print("-" * 70)
 
     # Select all objects for framing
-    bpy.ops.object.select_all(action='DESELECT')
-    for obj in objects_0 + objects_1:
-        obj.select_set(True)
-
-    if objects_0:
-        bpy.context.view_layer.objects.active = objects_0[0]
+    select_objects(objects_0 + objects_1, active=objects_0[0] if objects_0 else None)
 
     print("  ✓ Selected all orbital objects")
 
@@ -325,7 +268,8 @@ if __name__ == "__main__":
 
     # Create the states
     try:
-        objects_0, objects_1 = create_zero_one_states()
+        from Generators.hydrogen_orbital_meshes import batched_output
+        objects_0, objects_1 = batched_output(create_zero_one_states)()
         print("Done! Check the 3D viewport.")
     except Exception as e:
         print(f"\nERROR: {e}")
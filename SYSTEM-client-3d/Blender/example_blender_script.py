@@ -60,6 +60,7 @@ from Generators.hydrogen_orbital_meshes import (
     create_example_orbitals,
     create_bloch_sphere_states,
     clear_orbital_objects,
+    select_objects,
 )
 from Quantum.bloch_orbital_mapper import create_state
 from Quantum.quantum_constants import get_orbital_name
@@ -94,10 +95,7 @@ def example_1s_orbital():
 
     # Center view on orbital
     if objects:
-        bpy.ops.object.select_all(action='DESELECT')
-        for obj in objects:
-            obj.select_set(True)
-        bpy.context.view_layer.objects.active = objects[0]
+        select_objects(objects, active=objects[0])
         bpy.ops.view3d.view_selected()
 
     print("✓ 1s orbital created successfully!")
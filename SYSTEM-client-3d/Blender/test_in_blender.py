@@ -142,10 +142,10 @@ def test_calculations():
 
         # Verify spherical symmetry
         r = 5.0
-        points = [(r, 0, 0), (0, r, 0), (0, 0, r)]
-        values = [hydrogen_orbital(1, 0, 0, x, y, z) for x, y, z in points]
+        points = np.array([(r, 0, 0), (0, r, 0), (0, 0, r)])
+        values = hydrogen_orbital(1, 0, 0, points[:, 0], points[:, 1], points[:, 2])
 
-        if all(np.isclose(v, values[0]) for v in values):
+        if np.allclose(values, values[0]):
             print(f"  [PASS] 1s orbital is spherically symmetric")
         else:
             print(f"  [FAIL] 1s orbital not symmetric")
@@ -171,10 +171,7 @@ def test_bloch_state():
 
         # Create |+> state
         state = create_state('|+⟩')
-        probs = state.get_orbital_probabilities()
-
-        prob_1s = probs.get((1, 0, 0), 0)
-        prob_2s = probs.get((2, 0, 0), 0)
+        prob_1s, prob_2s = state.get_probability_array([(1, 0, 0), (2, 0, 0)])
 
         print(f"  Created |+> state:")
         print(f"    P(1s) = {prob_1s:.6f}")
@@ -200,7 +197,9 @@ def test_mesh_generation():
     print("=" * 70)
 
     try:
-        from Generators.hydrogen_orbital_meshes import create_orbital_mesh, clear_orbital_objects
+        from Generators.hydrogen_orbital_meshes import (
+            create_orbital_mesh, clear_orbital_objects, select_objects,
+        )
 
         # Clear any existing orbital objects
         clear_orbital_objects()
@@ -222,9 +221,7 @@ def test_mesh_generation():
             print(f"         Faces: {len(objects[0].data.polygons)}")
 
             # Center view on the object
-            bpy.ops.object.select_all(action='DESELECT')
-            objects[0].select_set(True)
-            bpy.context.view_layer.objects.active = objects[0]
+            select_objects([objects[0]], active=objects[0])
 
             print(f"\n  SUCCESS! Check the 3D viewport for the orbital mesh!")
             return True
@@ -6,6 +6,7 @@ Verifies:
 2. 2px orbital has correct shape along x-axis
 3. Bloch state (θ=π/2, φ=0) produces equal mix of |0⟩ and |1⟩
 4. Probability density integrates to 1
+5. A low isosurface can be extracted from a shared, read-only density grid
 """
 
 import numpy as np
@@ -17,10 +18,11 @@ script_dir = Path(__file__).parent / "Scripts"
 sys.path.insert(0, str(script_dir))
 
 from Quantum.hydrogen_wavefunctions import (
+    cached_density_grid,
     hydrogen_orbital,
     probability_density,
     verify_normalization,
-    verify_orthogonality,
+    verify_orthogonality_batch,
     radial_wavefunction,
 )
 from Quantum.bloch_orbital_mapper import (
@@ -31,6 +33,14 @@ from Quantum.bloch_orbital_mapper import (
 from Quantum.orbital_coefficients import bloch_to_orbital_coeffs
 from Quantum.quantum_constants import validate_quantum_numbers
 
+# Unit vectors along ±x, ±y, ±z: points at equal radius on every axis
+AXIS_LABELS = ('+x', '-x', '+y', '-y', '+z', '-z')
+AXIS_DIRECTIONS = np.array([
+    (1, 0, 0), (-1, 0, 0),
+    (0, 1, 0), (0, -1, 0),
+    (0, 0, 1), (0, 0, -1),
+], dtype=float)
+
 # ============================================================================
 # Test Functions
 # ============================================================================
@@ -44,30 +54,29 @@ def test_1s_spherical_symmetry():
     # Calculate 1s at same radius but different angles
     r = 5.0  # 5 Bohr radii
 
-    # Points at same radius
-    points = [
-        (r, 0, 0),    # +x axis
-        (0, r, 0),    # +y axis
-        (0, 0, r),    # +z axis
-        (-r, 0, 0),   # -x axis
-        (0, -r, 0),   # -y axis
-        (0, 0, -r),   # -z axis
-    ]
+    # Points at same radius, one on each half-axis
+    points = AXIS_DIRECTIONS * r
 
-    values = []
-    for x, y, z in points:
-        psi = hydrogen_orbital(1, 0, 0, x, y, z)
-        values.append(psi)
-        print(f"  ψ₁ₛ({x:+6.1f}, {y:+6.1f}, {z:+6.1f}) = {psi:+.6f}")
+    # One vectorized evaluation over all points
+    values = hydrogen_orbital(1, 0, 0, points[:, 0], points[:, 1], points[:, 2])
+    print("\n".join(
+        f"  ψ₁ₛ({x:+6.1f}, {y:+6.1f}, {z:+6.1f}) = {psi:+.6f}"
+        for (x, y, z), psi in zip(points, values)
+    ))
 
     # Check all values are equal (within numerical precision)
-    values = np.array(values)
     max_diff = np.max(np.abs(values - values[0]))
 
     print(f"\n  Maximum difference: {max_diff:.2e}")
     print(f"  All equal (tolerance 1e-10): {max_diff < 1e-10}")
 
-    if max_diff < 1e-10:
+    # The shared value is R₁₀(r)·Y₀₀, with R evaluated once for the radius
+    expected = radial_wavefunction(1, 0, r) / (2 * np.sqrt(np.pi))
+    matches_radial = np.allclose(values, expected, rtol=1e-10, atol=0)
+
+    print(f"  R₁₀(r)·Y₀₀ = {expected:+.6f}, matches: {matches_radial}")
+
+    if max_diff < 1e-10 and matches_radial:
         print("  ✓ PASSED: 1s orbital is spherically symmetric")
         return True
     else:
@@ -83,21 +92,15 @@ def test_2px_orbital_shape():
     r = 10.0  # 10 Bohr radii
 
     # 2px should have lobes along x-axis
-    points = {
-        '+x': (r, 0, 0),
-        '-x': (-r, 0, 0),
-        '+y': (0, r, 0),
-        '-y': (0, -r, 0),
-        '+z': (0, 0, r),
-        '-z': (0, 0, -r),
-    }
+    points = AXIS_DIRECTIONS * r
 
     print("  2px orbital (real form, m=1):")
-    values = {}
-    for label, (x, y, z) in points.items():
-        psi = hydrogen_orbital(2, 1, 1, x, y, z, real_form=True)
-        values[label] = psi
-        print(f"    {label:3s}: ψ₂ₚₓ({x:+6.1f}, {y:+6.1f}, {z:+6.1f}) = {psi:+.6f}")
+    psi_values = hydrogen_orbital(2, 1, 1, points[:, 0], points[:, 1], points[:, 2], real_form=True)
+    values = dict(zip(AXIS_LABELS, psi_values))
+    print("\n".join(
+        f"    {label:3s}: ψ₂ₚₓ({x:+6.1f}, {y:+6.1f}, {z:+6.1f}) = {psi:+.6f}"
+        for label, (x, y, z), psi in zip(AXIS_LABELS, points, psi_values)
+    ))
 
     # Check expectations:
     # - Values along x should be significant
@@ -156,9 +159,7 @@ def test_bloch_superposition():
         print(f"    ({n},{l},{m}): {coeff:.6f}, P = {prob:.6f}")
 
     # Check equal probabilities
-    probs = state.get_orbital_probabilities()
-    prob_1s = probs.get((1, 0, 0), 0)
-    prob_2s = probs.get((2, 0, 0), 0)
+    prob_1s, prob_2s = state.get_probability_array([(1, 0, 0), (2, 0, 0)])
 
     probs_equal = np.isclose(prob_1s, prob_2s, atol=1e-10)
     probs_half = np.isclose(prob_1s, 0.5, atol=1e-10)
@@ -232,29 +233,36 @@ def test_orthogonality():
 
     all_passed = True
 
-    for state1, state2 in pairs:
+    # All pairs share one quadrature grid and one evaluation per orbital
+    print(f"\n  Computing overlap integrals (this may take a moment)...")
+
+    try:
+        overlaps = verify_orthogonality_batch(pairs, r_max=20)
+    except Exception as e:
+        print(f"    ✗ ERROR: {e}")
+        overlaps = [None] * len(pairs)
+        all_passed = False
+
+    for (state1, state2), overlap in zip(pairs, overlaps):
         n1, l1, m1 = state1
         n2, l2, m2 = state2
 
         print(f"\n  Testing <ψ_{n1}{l1}{m1}|ψ_{n2}{l2}{m2}>")
-        print(f"    Computing overlap integral (this may take a moment)...")
 
-        try:
-            overlap = verify_orthogonality(n1, l1, m1, n2, l2, m2, r_max=20)
-            print(f"    Overlap = {overlap:.6f}")
+        if overlap is None:
+            print(f"    ✗ ERROR: overlap not computed")
+            continue
 
-            is_orthogonal = np.abs(overlap) < 0.01  # 1% tolerance
-            print(f"    Orthogonal (within 1%): {is_orthogonal}")
+        print(f"    Overlap = {overlap:.6f}")
 
-            if not is_orthogonal:
-                all_passed = False
-                print(f"    ✗ FAILED")
-            else:
-                print(f"    ✓ PASSED")
+        is_orthogonal = np.abs(overlap) < 0.01  # 1% tolerance
+        print(f"    Orthogonal (within 1%): {is_orthogonal}")
 
-        except Exception as e:
-            print(f"    ✗ ERROR: {e}")
+        if not is_orthogonal:
             all_passed = False
+            print(f"    ✗ FAILED")
+        else:
+            print(f"    ✓ PASSED")
 
     if all_passed:
         print("\n  ✓ PASSED: States are orthogonal")
@@ -299,13 +307,61 @@ def test_quantum_gates():
     final_correct = np.isclose(state.theta, np.pi, atol=1e-6)
     print(f"  Correct |1⟩ state: {final_correct}")
 
-    if h_correct and final_correct:
+    # The same sequence as one fused matrix must land on the same state
+    fused = create_state('|0⟩').apply_gates(['H', 'X', 'H'])
+    fused_matches = np.isclose(np.abs(np.vdot(fused.state_vector, state.state_vector)), 1.0, atol=1e-10)
+    print(f"\n  Fused H·X·H sequence: θ={fused.theta:.4f}, matches step-by-step: {fused_matches}")
+
+    if h_correct and final_correct and fused_matches:
         print("\n  ✓ PASSED: Gate operations work correctly")
         return True
     else:
         print("\n  ✗ FAILED: Gate operations incorrect")
         return False
 
+def test_cached_grid_isosurface():
+    """Test that a low shell can be extracted from a read-only cached grid."""
+    print("\n" + "=" * 70)
+    print("TEST 7: Isosurface From Cached Grid")
+    print("=" * 70)
+
+    from Generators.hydrogen_orbital_meshes import (
+        SKIMAGE_AVAILABLE,
+        generate_isosurface_meshes,
+        precompute_grid_params,
+    )
+
+    if not SKIMAGE_AVAILABLE:
+        print("  Skipped (scikit-image not installed)")
+        return True
+
+    all_passed = True
+
+    for n in (1, 2):
+        x_grid, y_grid, z_grid, density_grid = cached_density_grid(n, 0, 0, resolution=32)
+        spacing, origin = precompute_grid_params(x_grid, y_grid, z_grid)
+
+        # Low enough that the narrow band spans the whole y/z range, so the
+        # crop handed to marching cubes is a read-only contiguous view
+        iso_value = 1e-8 * float(density_grid.max())
+        mesh, = generate_isosurface_meshes(density_grid, spacing, origin, [iso_value])
+
+        extracted = mesh is not None and len(mesh[0]) > 0
+        print(f"  {n}s shell at 1e-8 of peak: "
+              f"{len(mesh[0]) if extracted else 0} vertices (read-only grid: "
+              f"{not density_grid.flags.writeable})")
+
+        if not extracted:
+            all_passed = False
+
+    if all_passed:
+        print("  ✓ PASSED: Shells extracted from the cached grid")
+    else:
+        print("  ✗ FAILED: Shell dropped for the read-only cached grid")
+
+    assert all_passed, "low isosurface of a cached_density_grid result was dropped"
+    return all_passed
+
 # ============================================================================
 # Main Test Runner
 # ============================================================================
@@ -321,6 +377,7 @@ def run_all_tests():
         ("2px Orbital Shape", test_2px_orbital_shape),
         ("Bloch Superposition", test_bloch_superposition),
         ("Quantum Gates", test_quantum_gates),
+        ("Cached Grid Isosurface", test_cached_grid_isosurface),
     ]
 
     # Optional slow tests
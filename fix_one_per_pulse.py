@@ -3,73 +3,77 @@
 Limit Object->Sphere departures to 1 transfer per source object per pulse
 """
 
-def main():
-    input_file = "SYSTEM-server/src/lib.rs"
-    
-    with open(input_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Replace the Object->Sphere processing loop
-    old_code = """    log::info!("[2s Pulse] Processing Object→Sphere and Sphere→Object departures");
+from apply_all_fixes import INPUT_FILE, patch_file
+from fix_pulse_errors import NEW_CODE_1 as PENDING_AT_OBJECT
+from patch_registry import DEPART_OR_LOG
+
+# Replace the Object->Sphere processing loop
+# (the header contains non-ASCII arrows, so it is encoded rather than b"")
+HEADER = """    log::info!("[2s Pulse] Processing Object→Sphere and Sphere→Object departures");
 
     // Process all transfers pending at source objects for Object→Sphere departure
-    for transfer in ctx.db.packet_transfer().iter() {
+""".encode('utf-8')
+
+# The loop as left by fix_pulse_errors.py
+OLD_CODE = HEADER + b"""    for transfer in ctx.db.packet_transfer().iter() {
         if transfer.completed {
             continue;
         }
 
-        if transfer.current_leg_type == "PendingAtObject" {
-            // Don't use ? operator - log errors and continue processing other transfers
-            if let Err(e) = depart_object_to_sphere(ctx, &transfer) {
-                log::error!("[2s Pulse] Failed to depart transfer {} from object to sphere: {}", transfer.transfer_id, e);
-                // Continue processing remaining transfers
-            }
-        }
+""" + PENDING_AT_OBJECT + b"""
     }"""
-    
-    new_code = """    log::info!("[2s Pulse] Processing Object→Sphere and Sphere→Object departures");
 
-    // Process all transfers pending at source objects for Object→Sphere departure
-    // LIMIT: Only one transfer per source object per pulse
-    let mut departed_sources: std::collections::HashSet<(String, u64)> = std::collections::HashSet::new();
+NEW_CODE = HEADER + b"""    // LIMIT: Only one transfer per source object per pulse
+    // Keyed by (source kind, source id) so no String is cloned per transfer
+    let mut departed_sources: std::collections::HashSet<(u8, u64)> = std::collections::HashSet::new();
     
+    // TODO: with #[index(btree)] on PacketTransfer::current_leg_type this scan
+    // could be ctx.db.packet_transfer().current_leg_type().filter("PendingAtObject")
     for transfer in ctx.db.packet_transfer().iter() {
         if transfer.completed {
             continue;
         }
 
         if transfer.current_leg_type == "PendingAtObject" {
-            // Check if this source has already departed a transfer this pulse
-            let source_key = (transfer.source_object_type.clone(), transfer.source_object_id);
-            if departed_sources.contains(&source_key) {
+            // Unknown source types share one kind, which can only hold them back
+            let source_kind: u8 = match transfer.source_object_type.as_str() {
+                "Player" => 0,
+                "StorageDevice" => 1,
+                "Miner" => 2,
+                _ => u8::MAX,
+            };
+            let source_key = (source_kind, transfer.source_object_id);
+            // Claim this source's departure for the pulse; insert returns
+            // false if the source already departed a transfer this pulse
+            if !departed_sources.insert(source_key) {
                 // Skip - this source already departed one transfer this pulse
                 continue;
             }
             
-            // Don't use ? operator - log errors and continue processing other transfers
-            if let Err(e) = depart_object_to_sphere(ctx, &transfer) {
-                log::error!("[2s Pulse] Failed to depart transfer {} from object to sphere: {}", transfer.transfer_id, e);
-                // Continue processing remaining transfers
+""" + DEPART_OR_LOG["object_to_sphere"] + b"""                // Release the claim so another transfer from this source can
+                // depart, then continue processing remaining transfers
+                departed_sources.remove(&source_key);
             } else {
-                // Mark this source as having departed a transfer
-                departed_sources.insert(source_key);
                 log::info!("[2s Pulse] Departed transfer {} from {} {}", 
                     transfer.transfer_id, transfer.source_object_type, transfer.source_object_id);
             }
         }
     }"""
-    
-    if old_code in content:
-        content = content.replace(old_code, new_code, 1)
-        print("[OK] Limited Object->Sphere to 1 transfer per source per pulse")
-    else:
-        print("[FAIL] Could not find Object->Sphere processing loop")
+
+# Only present once the fix is applied
+MARKER = b"departed_sources"
+
+# (old, new, ok_message, fail_message); the old blocks must not overlap
+PATCHES = [
+    (OLD_CODE, NEW_CODE,
+     "Limited Object->Sphere to 1 transfer per source per pulse",
+     "Could not find Object->Sphere processing loop"),
+]
+
+def main():
+    if not patch_file(INPUT_FILE, [(MARKER, PATCHES)]):
         return
-    
-    # Write back
-    with open(input_file, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
+
     print(f"\n[SUCCESS] Fixed pulse transfer rate limiting")
     print("- Added HashSet to track departed sources")
     print("- Skip additional transfers from same source in same pulse")
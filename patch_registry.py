@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+Rust snippets shared by the lib.rs fix scripts
+
+Code that more than one fix emits is generated here once, at import, so the
+fixes cannot drift apart.
+"""
+
+from string import Template
+
+# Departure that logs the error and carries on with the other transfers.
+# Opens the `if let Err(e)` block; the caller adds the rest of the error
+# branch and closes it.
+_DEPART_OR_LOG = Template("""\
+            // Don't use ? operator - log errors and continue processing other transfers
+            if let Err(e) = depart_${leg}(ctx, &transfer) {
+                log::error!("[2s Pulse] Failed to depart transfer {} from ${direction}: {}", transfer.transfer_id, e);
+""")
+
+# Keyed by leg: "object_to_sphere" and "sphere_to_object"
+DEPART_OR_LOG = {
+    leg: _DEPART_OR_LOG.substitute(leg=leg, direction=leg.replace('_', ' ')).encode('utf-8')
+    for leg in ("object_to_sphere", "sphere_to_object")
+}
@@ -0,0 +1,62 @@
+"""
+Check the lib.rs fixers on LF and CRLF (Windows core.autocrlf) checkouts
+
+Builds a small unpatched stand-in for lib.rs from the fixers' own old blocks,
+patches an LF and a CRLF copy of it and checks both come out the same apart
+from their line endings.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import apply_all_fixes
+import fix_frequency_tracking
+import fix_one_per_pulse
+import fix_pulse_errors
+
+FIXES = [
+    (fix.MARKER, fix.PATCHES)
+    for fix in (fix_frequency_tracking, fix_pulse_errors, fix_one_per_pulse)
+]
+
+def unpatched_source():
+    """Every patch site in its unpatched form, with \\n line endings."""
+    parts = [old for old, _, _, _ in fix_frequency_tracking.PATCHES]
+    # The one-per-pulse loop as it reads before the pulse error fix
+    parts.append(fix_one_per_pulse.OLD_CODE.replace(
+        fix_pulse_errors.NEW_CODE_1, fix_pulse_errors.OLD_CODE_1))
+    parts.append(fix_pulse_errors.OLD_CODE_2)
+    return b"\n\n".join(parts) + b"\n"
+
+def patch_copy(source):
+    """Patch source in a scratch directory and return the written bytes."""
+    cache_dir = apply_all_fixes.CACHE_DIR
+    with tempfile.TemporaryDirectory() as tmp:
+        apply_all_fixes.CACHE_DIR = Path(tmp) / "cache"
+        try:
+            path = Path(tmp) / "lib.rs"
+            path.write_bytes(source)
+            assert apply_all_fixes.patch_file(str(path), FIXES)
+            return path.read_bytes()
+        finally:
+            apply_all_fixes.CACHE_DIR = cache_dir
+
+def test_lf_checkout():
+    patched = patch_copy(unpatched_source())
+    for marker, _ in FIXES:
+        assert marker in patched
+    assert b"\r\n" not in patched
+
+def test_crlf_checkout():
+    source = unpatched_source()
+    patched_lf = patch_copy(source)
+    patched_crlf = patch_copy(source.replace(b"\n", b"\r\n"))
+    assert patched_crlf == patched_lf.replace(b"\n", b"\r\n")
+
+if __name__ == "__main__":
+    test_lf_checkout()
+    test_crlf_checkout()
+    print("[OK] LF and CRLF checkouts patch identically")